@@ -12,18 +12,26 @@ The MCP server communicates with REAPER through file-based IPC. The Lua listener
 (reaper_listener.lua) must be running inside REAPER for commands to work.
 """
 
-import asyncio
+import errno
+import functools
+import itertools
 import json
+import mmap
 import os
+import queue
+import select
 import shutil
 import stat
 import sys
-import tempfile
 import threading
 import time
-import uuid
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional — stdlib json fallback below
+    orjson = None
+
 # ---------------------------------------------------------------------------
 # Configuration — all from environment, no hardcoded paths
 # ---------------------------------------------------------------------------
@@ -47,10 +55,44 @@ POLL_INTERVAL = float(os.environ.get("REAPER_MCP_POLL_INTERVAL", "0.03"))
 TIMEOUT = float(os.environ.get("REAPER_MCP_TIMEOUT", "10"))
 
 
+# ---------------------------------------------------------------------------
+# JSON encoding — orjson when installed, stdlib otherwise
+# ---------------------------------------------------------------------------
+
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+
+    def _dumps_config(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+
+    def _loads_buffer(buf) -> dict:
+        with memoryview(buf) as view:
+            return orjson.loads(view)
+
+    def _dumps_pretty(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+else:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    def _dumps_config(obj) -> bytes:
+        return (json.dumps(obj, indent=2) + "\n").encode()
+
+    def _loads_buffer(buf) -> dict:
+        return json.loads(str(buf, "utf-8"))
+
+    def _dumps_pretty(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+
 # ---------------------------------------------------------------------------
 # Platform detection
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=1)
 def get_reaper_resource_path() -> Path | None:
     """Auto-detect REAPER's resource/config directory."""
     candidates = []
@@ -69,15 +111,17 @@ def get_reaper_resource_path() -> Path | None:
         candidates.insert(0, Path(env))
 
     for p in candidates:
-        if p.exists():
+        if os.path.exists(p):
             return p
     return candidates[0] if candidates else None
 
 
+@functools.lru_cache(maxsize=1)
 def get_claude_code_config_path() -> Path:
     return Path.home() / ".claude" / "mcp_servers.json"
 
 
+@functools.lru_cache(maxsize=1)
 def get_claude_desktop_config_path() -> Path:
     if sys.platform == "darwin":
         return (
@@ -101,6 +145,7 @@ def get_claude_desktop_config_path() -> Path:
 # Serialize all commands — prevents concurrent tool calls from clobbering
 # each other's command.json / response.json files.
 _ipc_lock = threading.Lock()
+_async_ipc_lock = None  # asyncio.Lock, created by the first async command
 
 def ensure_ipc_dir() -> None:
     IPC_DIR.mkdir(parents=True, exist_ok=True)
@@ -111,46 +156,360 @@ def ensure_ipc_dir() -> None:
             pass
 
 
-def send_command(action: str, params: dict | None = None) -> dict:
-    """Send a command to REAPER via file IPC and wait for response."""
-    with _ipc_lock:
-        return _send_command_locked(action, params)
+# Upper bound for a single watcher sleep, so a missed change notification
+# (e.g. on a network filesystem) costs at most this much extra latency.
+_WATCH_MAX_WAIT = 1.0
 
+# First sleep of the polling fallback; doubles up to the poll interval.
+_BACKOFF_START = 0.001
 
-def _send_command_locked(action: str, params: dict | None = None) -> dict:
-    ensure_ipc_dir()
-    cmd_id = str(uuid.uuid4())
-    cmd = {"id": cmd_id, "action": action, "params": params or {}}
+# inotify(7) event bits
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_IGNORED = 0x00008000
+_IN_GONE = _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_IGNORED
+
+# Win32 change-notification constants
+_FILE_NOTIFY_CHANGE_FILE_NAME = 0x00000001
+_FILE_NOTIFY_CHANGE_LAST_WRITE = 0x00000010
+_WAIT_OBJECT_0 = 0
 
+
+class IpcWatcher:
+    """
+    Sleep until something changes in IPC_DIR instead of polling on a timer.
+
+    Uses inotify on Linux, kqueue on macOS and a directory change-notification
+    handle on Windows. If the platform watcher can't be set up, wait() falls
+    back to polling with exponential backoff (1 ms, 2 ms, 4 ms, ... capped at
+    `poll_interval`), so fast responses are seen quickly while slow ones
+    don't cost a wakeup every few milliseconds.
+
+    Create it *before* publishing a command so the response can't slip in
+    between the write and the first wait.
+    """
+
+    def __init__(self, poll_interval: float = POLL_INTERVAL):
+        self.poll_interval = poll_interval
+        self._backoff = _BACKOFF_START
+        self._fd: int | None = None       # inotify fd / watched dir fd
+        self._kqueue = None               # macOS
+        self._handle: int | None = None   # Windows
+        self._kernel32 = None
+        # Set by drain() once the watched directory has been deleted or
+        # moved; the watch is dead from then on and must be reopened.
+        self.stale = False
+
+    def __enter__(self) -> "IpcWatcher":
+        try:
+            if sys.platform.startswith("linux"):
+                self._open_inotify()
+            elif sys.platform == "darwin":
+                self._open_kqueue()
+            elif sys.platform == "win32":
+                self._open_win32()
+        except (OSError, AttributeError, ValueError):
+            self.close()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def active(self) -> bool:
+        return (
+            self._fd is not None
+            or self._kqueue is not None
+            or self._handle is not None
+        )
+
+    def wait(self, timeout: float) -> None:
+        """Block until IPC_DIR changes or `timeout` seconds have passed."""
+        if timeout <= 0:
+            return
+        if not self.active:
+            time.sleep(min(timeout, self._backoff))
+            self._backoff = min(self._backoff * 2, self.poll_interval)
+            return
+        timeout = min(timeout, _WATCH_MAX_WAIT)
+        if self._kqueue is not None:
+            self._kqueue.control(None, 8, timeout)
+        elif self._handle is not None:
+            k32 = self._kernel32
+            if k32.WaitForSingleObject(self._handle, int(timeout * 1000)) == _WAIT_OBJECT_0:
+                k32.FindNextChangeNotification(self._handle)
+        elif select.select([self._fd], [], [], timeout)[0]:
+            self._drain_inotify()
+
+    def fileno(self) -> int | None:
+        """An fd that turns readable on changes, for event-loop integration."""
+        if self._kqueue is not None:
+            return self._kqueue.fileno()
+        return self._fd  # inotify fd on Linux; None on Windows / fallback
+
+    def drain(self) -> None:
+        """Discard pending notifications after a wakeup via fileno()."""
+        if self._kqueue is not None:
+            for event in self._kqueue.control(None, 8, 0):
+                if event.fflags & (select.KQ_NOTE_DELETE | select.KQ_NOTE_RENAME):
+                    self.stale = True
+        elif self._fd is not None:
+            self._drain_inotify()
+
+    def close(self) -> None:
+        if self._kqueue is not None:
+            self._kqueue.close()
+            self._kqueue = None
+        if self._handle is not None:
+            self._kernel32.FindCloseChangeNotification(self._handle)
+            self._handle = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    # -- Platform backends --
+
+    def _open_inotify(self) -> None:
+        import ctypes
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._fd = fd
+        wd = libc.inotify_add_watch(
+            fd, os.fsencode(IPC_DIR),
+            _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_DELETE_SELF | _IN_MOVE_SELF,
+        )
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_add_watch failed")
+
+    def _drain_inotify(self) -> None:
+        # Events only mean "look again" — the caller re-checks RSP_FILE —
+        # except the ones saying the directory itself is gone.
+        try:
+            while True:
+                buf = os.read(self._fd, 4096)
+                if not buf:
+                    break
+                # struct inotify_event: int wd; u32 mask, cookie, len; name[len]
+                offset = 0
+                while offset + 16 <= len(buf):
+                    mask = int.from_bytes(buf[offset + 4:offset + 8], sys.byteorder)
+                    if mask & _IN_GONE:
+                        self.stale = True
+                    offset += 16 + int.from_bytes(buf[offset + 12:offset + 16], sys.byteorder)
+        except BlockingIOError:
+            pass
+
+    def _open_kqueue(self) -> None:
+        self._fd = os.open(IPC_DIR, getattr(os, "O_EVTONLY", os.O_RDONLY))
+        self._kqueue = select.kqueue()
+        self._kqueue.control([select.kevent(
+            self._fd,
+            filter=select.KQ_FILTER_VNODE,
+            flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+            fflags=(
+                select.KQ_NOTE_WRITE | select.KQ_NOTE_EXTEND
+                | select.KQ_NOTE_DELETE | select.KQ_NOTE_RENAME
+            ),
+        )], 0, 0)
+
+    def _open_win32(self) -> None:
+        import ctypes
+        from ctypes import wintypes
+
+        k32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        k32.FindFirstChangeNotificationW.restype = wintypes.HANDLE
+        k32.FindFirstChangeNotificationW.argtypes = [
+            wintypes.LPCWSTR, wintypes.BOOL, wintypes.DWORD,
+        ]
+        k32.FindNextChangeNotification.argtypes = [wintypes.HANDLE]
+        k32.FindCloseChangeNotification.argtypes = [wintypes.HANDLE]
+        k32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+        k32.WaitForSingleObject.restype = wintypes.DWORD
+        # ReadDirectoryChangesW would also report *which* file changed, but we
+        # re-check RSP_FILE on every wakeup anyway, so a plain change
+        # notification handle is enough and needs no OVERLAPPED plumbing.
+        handle = k32.FindFirstChangeNotificationW(
+            str(IPC_DIR), False,
+            _FILE_NOTIFY_CHANGE_FILE_NAME | _FILE_NOTIFY_CHANGE_LAST_WRITE,
+        )
+        if not handle or handle == ctypes.c_void_p(-1).value:
+            raise ctypes.WinError(ctypes.get_last_error())
+        self._kernel32 = k32
+        self._handle = handle
+
+
+# Command ids only have to be unique among this process's own commands, so
+# pid + counter is enough and skips uuid4's trip to os.urandom.
+_PID = os.getpid()
+_CMD_COUNTER_NEXT = itertools.count().__next__
+
+
+def _new_cmd_id() -> str:
+    return f"{_PID}-{_CMD_COUNTER_NEXT()}"
+
+
+# Command JSON for tools that take no arguments is encoded once at import
+# (see _CMD_TEMPLATES after TOOL_SPECS); per call only the id slot gets
+# filled in.
+_CMD_ID_SLOT = b"_" * 36
+
+
+def _encode_command(cmd_id: str, action: str, params: dict | None) -> bytes:
+    if not params:
+        template = _CMD_TEMPLATES.get(action)
+        if template is not None:
+            return template.replace(_CMD_ID_SLOT, cmd_id.encode())
+    return _dumps({"id": cmd_id, "action": action, "params": params or {}})
+
+
+# Flipped once O_TMPFILE turns out not to work here (non-Linux, old kernel,
+# filesystem without support, no /proc), so we stop trying.
+_tmpfile_unsupported = not hasattr(os, "O_TMPFILE")
+
+
+# linkat() errors meaning the O_TMPFILE path can never work in this process
+_LINK_UNSUPPORTED_ERRNOS = (errno.ENOENT, errno.EPERM, errno.EXDEV, errno.EOPNOTSUPP)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _link_tmpfile(fd: int) -> None:
+    """Give the anonymous O_TMPFILE inode behind `fd` the name CMD_FILE."""
+    proc_path = f"/proc/self/fd/{fd}"
     try:
-        RSP_FILE.unlink(missing_ok=True)
-    except OSError:
-        pass
+        os.link(proc_path, CMD_FILE)  # linkat(..., AT_SYMLINK_FOLLOW)
+    except FileExistsError:
+        # Previous command not picked up yet — replace it (unless the
+        # listener takes it first)
+        try:
+            os.unlink(CMD_FILE)
+        except FileNotFoundError:
+            pass
+        os.link(proc_path, CMD_FILE)
+
+
+def _publish_command(data: bytes) -> None:
+    """
+    Atomically publish `data` as CMD_FILE.
 
+    On Linux this writes an anonymous O_TMPFILE inode and links it into place,
+    so there's no temp name to probe for and nothing left behind on a crash.
+    Elsewhere it falls back to temp file + rename.
+    """
+    global _tmpfile_unsupported
+    if not _tmpfile_unsupported:
+        try:
+            fd = os.open(IPC_DIR, os.O_TMPFILE | os.O_WRONLY, 0o600)
+        except OSError as e:
+            if e.errno not in (errno.EOPNOTSUPP, errno.EISDIR, errno.EINVAL):
+                raise
+            _tmpfile_unsupported = True
+        else:
+            try:
+                _write_all(fd, data)
+                try:
+                    _link_tmpfile(fd)
+                    return
+                except OSError as e:
+                    # No /proc, or a sandbox or filesystem that refuses the
+                    # link. Anything else is a real write failure.
+                    if e.errno not in _LINK_UNSUPPORTED_ERRNOS:
+                        raise
+                    _tmpfile_unsupported = True
+            finally:
+                os.close(fd)
+
+    # Unique per process and command, so no mkstemp name probing (or its
+    # extra fchmod) is needed — IPC_DIR itself is already owner-only.
+    tmp_path = os.path.join(IPC_DIR, f".cmd.{_PID}.{_CMD_COUNTER_NEXT()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
     try:
-        fd, tmp_path = tempfile.mkstemp(dir=IPC_DIR, suffix=".tmp")
-        with os.fdopen(fd, "w") as f:
-            json.dump(cmd, f)
-        os.replace(tmp_path, CMD_FILE)
-    except OSError as e:
-        return {
-            "id": cmd_id, "success": False, "result": None,
-            "error": f"Failed to write command file: {e}",
-        }
+        _write_all(fd, data)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, CMD_FILE)
+
+
+def send_command(
+    action: str,
+    params: dict | None = None,
+    *,
+    timeout: float | None = None,
+    poll_interval: float | None = None,
+) -> dict:
+    """
+    Send a command to REAPER via file IPC and wait for response.
+    `timeout` and `poll_interval` default to TIMEOUT and POLL_INTERVAL.
+    """
+    if timeout is None:
+        timeout = TIMEOUT
+    if poll_interval is None:
+        poll_interval = POLL_INTERVAL
+    cmd_id = _new_cmd_id()
+    data = _encode_command(cmd_id, action, params)
+    with _ipc_lock:
+        return _exchange(cmd_id, data, timeout, poll_interval)
+
+
+# Responses larger than this are parsed straight out of an mmap instead of
+# being read into an intermediate buffer first. get_session_state on a big
+# project easily runs to megabytes; below this, mmap setup isn't worth it.
+_MMAP_THRESHOLD = 16 * 1024
+
 
-    start = time.monotonic()
-    while time.monotonic() - start < TIMEOUT:
-        if RSP_FILE.exists():
+def _read_response(cmd_id: str) -> dict | None:
+    """Consume RSP_FILE if present. Returns it only if it answers `cmd_id`."""
+    try:
+        fd = os.open(RSP_FILE, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    except OSError:
+        return None
+    response = None
+    try:
+        if sys.platform != "win32":
+            # Unlink right away — the open fd keeps the data readable, and
+            # it saves a second path lookup after reading.
             try:
-                content = RSP_FILE.read_text(encoding="utf-8")
-                RSP_FILE.unlink(missing_ok=True)
-                response = json.loads(content)
-                if response.get("id") == cmd_id:
-                    return response
-            except (json.JSONDecodeError, OSError):
+                os.unlink(RSP_FILE)
+            except OSError:
+                pass
+        size = os.fstat(fd).st_size
+        if size > _MMAP_THRESHOLD:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                response = _loads_buffer(mm)
+        else:
+            response = _loads(b"".join(iter(lambda: os.read(fd, size or 4096), b"")))
+    except (ValueError, OSError):
+        pass
+    finally:
+        os.close(fd)
+        if sys.platform == "win32":
+            # Windows can't delete a file that's still open
+            try:
+                os.unlink(RSP_FILE)
+            except OSError:
                 pass
-        time.sleep(POLL_INTERVAL)
+    if response is not None and response.get("id") == cmd_id:
+        return response
+    return None
 
+
+def _write_failed_response(cmd_id: str, e: OSError) -> dict:
+    return {
+        "id": cmd_id, "success": False, "result": None,
+        "error": f"Failed to write command file: {e}",
+    }
+
+
+def _timeout_response(cmd_id: str) -> dict:
     return {
         "id": cmd_id, "success": False, "result": None,
         "error": (
@@ -161,10 +520,287 @@ def _send_command_locked(action: str, params: dict | None = None) -> dict:
     }
 
 
+def _exchange(cmd_id: str, data: bytes, timeout: float, poll_interval: float) -> dict:
+    """Publish an encoded command and wait for its response. Hold _ipc_lock."""
+    ensure_ipc_dir()
+    try:
+        RSP_FILE.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+    with IpcWatcher(poll_interval) as watcher:
+        try:
+            _publish_command(data)
+        except OSError as e:
+            return _write_failed_response(cmd_id, e)
+
+        deadline = time.monotonic() + timeout
+        while True:
+            response = _read_response(cmd_id)
+            if response is not None:
+                return response
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            watcher.wait(remaining)
+
+    return _timeout_response(cmd_id)
+
+
+# One long-lived thread runs the blocking parts of the async path (publishing
+# the command file, or the whole exchange when there is no watcher fd). IPC
+# is serial anyway, so this avoids a default-executor hand-off per call.
+_worker_jobs: queue.SimpleQueue = queue.SimpleQueue()
+_worker_thread: threading.Thread | None = None
+_worker_start_lock = threading.Lock()
+
+
+def _ipc_worker() -> None:
+    while True:
+        fn, args, loop, future = _worker_jobs.get()
+        try:
+            result = fn(*args)
+        except Exception as e:
+            settle, value = _set_future_exception, e
+        else:
+            settle, value = _set_future_result, result
+        try:
+            loop.call_soon_threadsafe(settle, future, value)
+        except RuntimeError:  # loop already closed; nobody is waiting
+            pass
+
+
+def _set_future_result(future, result) -> None:
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_future_exception(future, exc: Exception) -> None:
+    if not future.done():
+        future.set_exception(exc)
+
+
+def _run_on_worker(fn, *args):
+    """Run fn(*args) on the IPC worker thread; returns an awaitable future."""
+    import asyncio
+
+    global _worker_thread
+    if _worker_thread is None:
+        with _worker_start_lock:
+            if _worker_thread is None:
+                _worker_thread = threading.Thread(
+                    target=_ipc_worker, name="reaper-ipc", daemon=True,
+                )
+                _worker_thread.start()
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    _worker_jobs.put((fn, args, loop, future))
+    return future
+
+
+async def send_command_async(action: str, params: dict | None = None) -> dict:
+    """
+    Async send_command for the MCP server: waits for the response on the
+    event loop (via the watcher fd) instead of parking a thread in a poll
+    loop. Falls back to the blocking wait in a thread when the watcher has
+    no pollable fd (Windows, or no watcher at all).
+    """
+    cmd_id = _new_cmd_id()
+    return await _exchange_async(cmd_id, _encode_command(cmd_id, action, params), TIMEOUT)
+
+
+# The server keeps one watcher open for its lifetime rather than setting up
+# and tearing down an inotify/kqueue watch for every tool call.
+_async_watcher: IpcWatcher | None = None
+
+
+def _get_async_watcher() -> IpcWatcher | None:
+    """
+    The long-lived watcher, drained; reopened if IPC_DIR was replaced.
+    None when there is no pollable fd to wait on: always on Windows, or if
+    the watcher can't be opened right now (retried on the next call).
+    """
+    global _async_watcher
+    if sys.platform == "win32":
+        return None  # change-notification handles have no fd for add_reader
+    if _async_watcher is not None:
+        # Events left over from the previous exchange would only cause a
+        # spurious first wakeup.
+        _async_watcher.drain()
+        if _async_watcher.stale:
+            _async_watcher.close()
+            _async_watcher = None
+    if _async_watcher is None:
+        watcher = IpcWatcher().__enter__()
+        if watcher.fileno() is None:
+            watcher.close()
+            return None
+        _async_watcher = watcher
+    return _async_watcher
+
+
+async def _exchange_async(cmd_id: str, data: bytes, timeout: float) -> dict:
+    import asyncio
+
+    global _async_ipc_lock
+    if _async_ipc_lock is None:
+        _async_ipc_lock = asyncio.Lock()
+    loop = asyncio.get_running_loop()
+    async with _async_ipc_lock:
+        ensure_ipc_dir()
+        watcher = _get_async_watcher()
+        if watcher is None:
+            def exchange_locked() -> dict:
+                with _ipc_lock:
+                    return _exchange(cmd_id, data, timeout, POLL_INTERVAL)
+            return await _run_on_worker(exchange_locked)
+
+        try:
+            RSP_FILE.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+        fd = watcher.fileno()
+        changed = asyncio.Event()
+        loop.add_reader(fd, changed.set)
+        try:
+            try:
+                await _run_on_worker(_publish_command, data)
+            except OSError as e:
+                return _write_failed_response(cmd_id, e)
+
+            deadline = loop.time() + timeout
+            while True:
+                response = _read_response(cmd_id)
+                if response is not None:
+                    return response
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    await asyncio.wait_for(
+                        changed.wait(), min(remaining, _WATCH_MAX_WAIT),
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                changed.clear()
+                watcher.drain()
+        finally:
+            loop.remove_reader(fd)
+
+    return _timeout_response(cmd_id)
+
+
+# ---------------------------------------------------------------------------
+# Batching
+# Tool calls that arrive within _BATCH_WINDOW of each other are sent to the
+# listener as one {"batch": [...]} command, so N concurrent calls cost one
+# file round trip and one REAPER defer tick instead of N.
+# ---------------------------------------------------------------------------
+
+_BATCH_WINDOW = 0.002
+_MAX_CMD_SIZE = 1024 * 1024  # the listener's MAX_CMD_SIZE; larger files are rejected
+_batch_pending: list = []       # (action, params, future)
+_batch_flush_handle = None      # asyncio.TimerHandle while a flush is scheduled
+_batch_tasks: set = set()       # keeps running flush tasks referenced
+_listener_batches: bool | None = None  # from the ping handshake; None = unknown
+
+
+async def send_command_batched(action: str, params: dict | None = None) -> dict:
+    """send_command_async, coalesced with any other calls in the same window."""
+    import asyncio
+
+    global _batch_flush_handle
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    _batch_pending.append((action, params, future))
+    if _batch_flush_handle is None:
+        _batch_flush_handle = loop.call_later(_BATCH_WINDOW, _start_batch_flush, loop)
+    return await future
+
+
+def _start_batch_flush(loop) -> None:
+    global _batch_flush_handle
+    _batch_flush_handle = None
+    pending = _batch_pending[:]
+    _batch_pending.clear()
+    task = loop.create_task(_flush_batch(pending))
+    _batch_tasks.add(task)
+    task.add_done_callback(_batch_tasks.discard)
+
+
+async def _flush_batch(pending: list) -> None:
+    import asyncio
+
+    try:
+        data = None
+        if len(pending) > 1 and await _listener_supports_batch():
+            batch_id = _new_cmd_id()
+            ids = [_new_cmd_id() for _ in pending]
+            data = _dumps({
+                "id": batch_id,
+                "batch": [
+                    {"id": cmd_id, "action": action, "params": params or {}}
+                    for cmd_id, (action, params, _) in zip(ids, pending)
+                ],
+            })
+            if len(data) > _MAX_CMD_SIZE:
+                # Calls that fit on their own can still overflow together
+                data = None
+
+        if data is None:
+            for action, params, future in pending:
+                response = await send_command_async(action, params)
+                if not future.done():
+                    future.set_result(response)
+            return
+
+        global _listener_batches
+        response = await _exchange_async(batch_id, data, TIMEOUT * len(pending))
+        if not response.get("success"):
+            # Maybe the listener was swapped for one without batch support
+            _listener_batches = None
+        by_id = {r.get("id"): r for r in response.get("responses") or []}
+        for cmd_id, (_, _, future) in zip(ids, pending):
+            if future.done():
+                continue
+            future.set_result(by_id.get(cmd_id) or {
+                "id": cmd_id, "success": False, "result": None,
+                "error": response.get("error") or "Missing from batch response",
+            })
+    except asyncio.CancelledError:
+        for _, _, future in pending:
+            future.cancel()
+        raise
+    except Exception as e:
+        for _, _, future in pending:
+            if not future.done():
+                future.set_exception(e)
+
+
+async def _listener_supports_batch() -> bool:
+    global _listener_batches
+    if _listener_batches is None:
+        response = await send_command_async("ping")
+        if not response.get("success"):
+            return False  # don't cache — the listener may just not be up yet
+        _listener_batches = bool((response.get("result") or {}).get("batch"))
+    return _listener_batches
+
+
 # ---------------------------------------------------------------------------
 # JSON config file merging
 # ---------------------------------------------------------------------------
 
+def _write_config(path: Path, data: bytes) -> None:
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        _write_all(fd, data)
+    finally:
+        os.close(fd)
+
+
 def merge_json_config(path: Path, key_path: list[str], value: dict) -> bool:
     """
     Safely merge a value into a nested JSON config file.
@@ -172,15 +808,16 @@ def merge_json_config(path: Path, key_path: list[str], value: dict) -> bool:
     Returns True if the file was modified.
     """
     config = {}
-    if path.exists():
-        try:
-            text = path.read_text(encoding="utf-8")
-            if text.strip():
-                config = json.loads(text)
-        except (json.JSONDecodeError, OSError) as e:
-            print(f"  WARNING: Could not parse {path}: {e}")
-            print(f"  Skipping — please add the config manually.")
-            return False
+    try:
+        raw = path.read_bytes()
+        if raw.strip():
+            config = _loads(raw)
+    except FileNotFoundError:
+        pass
+    except (ValueError, OSError) as e:
+        print(f"  WARNING: Could not parse {path}: {e}")
+        print(f"  Skipping — please add the config manually.")
+        return False
 
     # Navigate to the right nesting level
     current = config
@@ -195,17 +832,15 @@ def merge_json_config(path: Path, key_path: list[str], value: dict) -> bool:
 
     current[final_key] = value
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(config, indent=2) + "\n", encoding="utf-8")
+    _write_config(path, _dumps_config(config))
     return True
 
 
 def remove_json_config_key(path: Path, key_path: list[str]) -> bool:
     """Remove a key from a nested JSON config file. Returns True if modified."""
-    if not path.exists():
-        return False
     try:
-        config = json.loads(path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
+        config = _loads(path.read_bytes())
+    except (ValueError, OSError):  # includes a missing file
         return False
 
     current = config
@@ -218,7 +853,7 @@ def remove_json_config_key(path: Path, key_path: list[str]) -> bool:
         return False
 
     del current[key_path[-1]]
-    path.write_text(json.dumps(config, indent=2) + "\n", encoding="utf-8")
+    _write_config(path, _dumps_config(config))
     return True
 
 
@@ -226,6 +861,7 @@ def remove_json_config_key(path: Path, key_path: list[str]) -> bool:
 # Install / Uninstall / Check
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=1)
 def get_mcp_server_config() -> dict:
     """Build the MCP server config entry for this installation."""
     project_dir = get_project_dir()
@@ -235,7 +871,7 @@ def get_mcp_server_config() -> dict:
         python_path = str(project_dir / ".venv" / "bin" / "python")
 
     # Fall back to current interpreter if venv doesn't exist yet
-    if not Path(python_path).exists():
+    if not os.path.exists(python_path):
         python_path = str(Path(sys.executable).resolve())
 
     return {
@@ -397,25 +1033,33 @@ def cmd_check():
         print(f"  [FAIL] mcp package not installed — run: pip install mcp")
         all_ok = False
 
+    # Stat every path we report on once, up front
+    reaper_path = get_reaper_resource_path()
+    cc_path = get_claude_code_config_path()
+    cd_path = get_claude_desktop_config_path()
+    paths = [IPC_DIR, cc_path, cd_path]
+    if reaper_path:
+        lua_dst = reaper_path / "Scripts" / "reaper_mcp_listener.lua"
+        jsfx_dst = reaper_path / "Effects" / "mcp_analyzer.jsfx"
+        paths += [reaper_path, lua_dst, jsfx_dst]
+    exists = {p: os.path.exists(p) for p in paths}
+
     # IPC directory
-    ipc_ok = IPC_DIR.exists()
+    ipc_ok = exists[IPC_DIR]
     status = "OK" if ipc_ok else "MISSING"
     print(f"  [{status}] IPC directory: {IPC_DIR}")
     if not ipc_ok:
         all_ok = False
 
     # REAPER resource path
-    reaper_path = get_reaper_resource_path()
-    if reaper_path and reaper_path.exists():
+    if reaper_path and exists[reaper_path]:
         print(f"  [OK] REAPER resource path: {reaper_path}")
-        lua_dst = reaper_path / "Scripts" / "reaper_mcp_listener.lua"
-        if lua_dst.exists():
+        if exists[lua_dst]:
             print(f"  [OK] Listener script installed in REAPER")
         else:
             print(f"  [MISSING] Listener script not in REAPER Scripts dir")
             all_ok = False
-        jsfx_dst = reaper_path / "Effects" / "mcp_analyzer.jsfx"
-        if jsfx_dst.exists():
+        if exists[jsfx_dst]:
             print(f"  [OK] MCP Analyzer JSFX installed")
         else:
             print(f"  [MISSING] MCP Analyzer JSFX not in REAPER Effects dir")
@@ -426,8 +1070,7 @@ def cmd_check():
         all_ok = False
 
     # Claude Code config
-    cc_path = get_claude_code_config_path()
-    if cc_path.exists():
+    if exists[cc_path]:
         try:
             cc = json.loads(cc_path.read_text())
             if "reaper" in cc:
@@ -442,8 +1085,7 @@ def cmd_check():
         print(f"  [MISSING] Claude Code config: {cc_path}")
 
     # Claude Desktop config
-    cd_path = get_claude_desktop_config_path()
-    if cd_path.exists():
+    if exists[cd_path]:
         try:
             cd = json.loads(cd_path.read_text())
             if "reaper" in cd.get("mcpServers", {}):
@@ -458,7 +1100,7 @@ def cmd_check():
     # Ping REAPER (quick check)
     print()
     print("  Pinging REAPER...", end="", flush=True)
-    response = _quick_ping()
+    response = send_command("ping", timeout=2.0, poll_interval=0.05)
     if response.get("success"):
         result = response.get("result", {})
         print(f" Connected!")
@@ -477,1237 +1119,1285 @@ def cmd_check():
     print()
 
 
-def _quick_ping() -> dict:
-    """Ping REAPER with a short timeout."""
-    ensure_ipc_dir()
-    cmd_id = str(uuid.uuid4())
-    cmd = {"id": cmd_id, "action": "ping", "params": {}}
-
-    try:
-        RSP_FILE.unlink(missing_ok=True)
-    except OSError:
-        pass
-    try:
-        fd, tmp_path = tempfile.mkstemp(dir=IPC_DIR, suffix=".tmp")
-        with os.fdopen(fd, "w") as f:
-            json.dump(cmd, f)
-        os.replace(tmp_path, CMD_FILE)
-    except OSError:
-        return {"success": False}
-
-    start = time.monotonic()
-    while time.monotonic() - start < 2.0:
-        if RSP_FILE.exists():
-            try:
-                content = RSP_FILE.read_text(encoding="utf-8")
-                RSP_FILE.unlink(missing_ok=True)
-                response = json.loads(content)
-                if response.get("id") == cmd_id:
-                    return response
-            except (json.JSONDecodeError, OSError):
-                pass
-        time.sleep(0.05)
-    return {"success": False}
-
-
 # ---------------------------------------------------------------------------
-# MCP Server (only imported when actually running as server)
+# Prompt and tool definitions
+# Plain data at module scope: built once at import, importable without mcp.
+# run_server wraps the specs in mcp.types.Tool.
 # ---------------------------------------------------------------------------
 
-def run_server():
-    from mcp.server import Server
-    from mcp.server.stdio import stdio_server
-    from mcp.types import (
-        Tool,
-        TextContent,
-        Prompt,
-        PromptMessage,
-        GetPromptResult,
-    )
-
-    server = Server("reaper")
-
-    def make_result(response: dict) -> list[TextContent]:
-        if response.get("success"):
-            text = json.dumps(response.get("result", {}), indent=2)
-        else:
-            text = f"Error: {response.get('error', 'Unknown error')}"
-        return [TextContent(type="text", text=text)]
-
-    # -- Prompt: REAPER Assistant --
-    @server.list_prompts()
-    async def list_prompts() -> list[Prompt]:
-        return [
-            Prompt(
-                name="reaper-assistant",
-                description=(
-                    "REAPER DAW assistant — gives Claude context about how to "
-                    "use the REAPER tools effectively"
-                ),
-            ),
-        ]
-
-    @server.get_prompt()
-    async def get_prompt(name: str, arguments: dict | None = None) -> GetPromptResult:
-        if name != "reaper-assistant":
-            raise ValueError(f"Unknown prompt: {name}")
-        return GetPromptResult(
-            messages=[
-                PromptMessage(
-                    role="user",
-                    content=TextContent(
-                        type="text",
-                        text=(
-                            "You are connected to REAPER (a digital audio workstation) via MCP tools. "
-                            "You can control the DAW through natural language.\n\n"
-                            "WORKFLOW:\n"
-                            "1. ALWAYS call get_session_state first to see what tracks, FX, routing, "
-                            "and items exist in the project before making changes.\n"
-                            "2. Use the tool results to understand the current state before acting.\n"
-                            "3. When asked to do something, translate it into the appropriate tool calls.\n\n"
-                            "CONVENTIONS:\n"
-                            "- Track names use partial, case-insensitive matching ('vox' finds 'Vox Lead')\n"
-                            "- Volume is in dB (0 = unity gain, -6 = half volume)\n"
-                            "- Pan is -100 (full left) to 100 (full right)\n"
-                            "- FX parameters: call get_fx_params first to see parameter names and ranges\n"
-                            "- Everything you do is wrapped in undo blocks — the user can Ctrl+Z any action\n\n"
-                            "METERING:\n"
-                            "- Use get_track_meter / get_master_meter to check levels (playback must be running)\n"
-                            "- Check for clipping before and after making changes\n\n"
-                            "TIPS:\n"
-                            "- For EQ: add ReaEQ, then use get_fx_params to find band parameters\n"
-                            "- For compression: add ReaComp, check params for threshold/ratio/attack/release\n"
-                            "- For sends/buses: create_track for the bus, then create_send from source tracks\n"
-                            "- Don't know which plugin? Call list_installed_fx with a category filter\n"
-                            "- For automation: add_envelope_points with 'Volume', 'Pan', or 'FXName:ParamName'\n"
-                            "- For organization: create_folder to group tracks (e.g., all drums)\n"
-                            "- For rendering: render_project uses REAPER's last format settings\n"
-                            "- toggle_phase for multi-mic phase issues (kick, snare, DI/amp)\n"
-                            "- You can chain multiple operations in sequence\n"
-                            "- If a track name is ambiguous, the error will list the matches — ask the user to clarify\n\n"
-                            "VIBE-BASED SOUND DESIGN:\n"
-                            "When the user describes sounds with creative/vague terms, translate them into concrete FX.\n"
-                            "- Call get_preferences FIRST to check for user plugin and style preferences\n"
-                            "- Call get_session_state to see existing FX (don't duplicate)\n"
-                            "- Use list_installed_fx to check for preferred or third-party plugins\n"
-                            "- Use apply_fx_chain to apply multiple FX with params in a single call\n"
-                            "- Multiple small moves > one big move (gentle EQ + light compression, not extreme settings)\n"
-                            "- Always explain what you're doing and why\n"
-                            "- When the user says 'I like X for Y' or 'always use X', call set_preference to save it\n\n"
-                            "REAPER BUILT-IN PLUGIN PARAMETER REFERENCE:\n"
-                            "Use these param names directly with apply_fx_chain (no need to call get_fx_params first):\n"
-                            "- ReaEQ: 'Band N Freq', 'Band N Gain', 'Band N BW' (bandwidth), "
-                            "'Band N Type' (0=band, 1=lowshelf, 2=highshelf, 3=highpass, 4=lowpass, 5=notch, "
-                            "6=bandpass, 8=allpass), 'Band N Enabled' (where N = 1-8)\n"
-                            "- ReaComp: 'Thresh' (dB, 0 to -60), 'Ratio', 'Attack' (ms), 'Release' (ms), "
-                            "'Knee', 'Pre-Comp' (lookahead), 'Wet', 'Dry'\n"
-                            "- ReaDelay: 'Length' (ms), 'Feedback', 'Wet', 'Dry', 'Lowpass', 'Highpass'\n"
-                            "- ReaVerbate: 'Room Size', 'Dampening', 'Stereo Width', 'Wet', 'Dry', 'Initial Delay'\n"
-                            "- ReaXcomp: multi-band compressor with per-band thresholds\n"
-                            "- JS: Saturation: 'Drive', 'Output', 'Mix'\n\n"
-                            "COMMON VIBES → FX TRANSLATION:\n"
-                            "- 'warm' → gentle low-shelf boost (+2-3dB ~200-300Hz), slight HF rolloff, light saturation\n"
-                            "- 'bright/airy' → high-shelf boost ~8-12kHz, slight presence boost 3-5kHz\n"
-                            "- 'moist/lush' → chorus or short modulated delay, gentle reverb\n"
-                            "- 'punchy' → compression with fast attack, medium release, moderate ratio\n"
-                            "- 'spacious/wide' → stereo reverb, stereo delay, Haas effect\n"
-                            "- 'crispy/gritty' → saturation/distortion, presence boost\n"
-                            "- 'thick/fat' → low-mid boost, compression, maybe parallel compression\n"
-                            "- 'clean' → remove or reduce existing FX, cut muddy frequencies\n"
-                            "- 'tight' → compression with fast attack, gate for noise, cut low frequencies\n"
-                            "- 'sparkle' → high-frequency shelf boost, exciter/saturation on highs\n"
-                            "- 'muddy (fix)' → cut 200-500Hz, add clarity with high boost\n"
-                            "- 'sit in the mix' → EQ to carve space, compression for dynamics, volume adjustment\n"
-                            "- 'lo-fi' → bit reduction, tape saturation, bandpass filter, vinyl noise\n"
-                            "- 'radio' → bandpass 300Hz-3kHz, light compression, subtle distortion\n"
-                            "These are starting points — adjust based on context, instrument, and user preferences.\n\n"
-                            "SPECTRAL ANALYSIS & LUFS METERING:\n"
-                            "- Use analyze_track to get 5-band spectral energy, peak/RMS, and crest factor\n"
-                            "- Use get_loudness for short-term/integrated LUFS and K-weighted RMS\n"
-                            "- Playback MUST be running for live readings — warn the user if stopped\n"
-                            "- The MCP Analyzer JSFX is added automatically (transparent, no audio modification)\n"
-                            "- Use spectral data to make informed EQ decisions rather than guessing\n\n"
-                            "MIX AUDIT:\n"
-                            "- Run audit_mix to diagnose the entire project at once\n"
-                            "- Fix errors first (clipping), then warnings (hot tracks, low headroom), then info\n"
-                            "- Playback should be running for accurate level checks\n\n"
-                            "GAIN STAGING:\n"
-                            "- auto_gain_stage adjusts faders to target -18dBFS (or custom target)\n"
-                            "- Must run during a representative loud section (chorus, drop)\n"
-                            "- Only adjusts faders, not item gain — fully reversible with Ctrl+Z\n\n"
-                            "INSTRUMENT TEMPLATES:\n"
-                            "- get_instrument_templates returns EQ+compression presets for specific instruments\n"
-                            "- Workflow: get_instrument_templates('vocals') → pass fx_chain to apply_fx_chain\n"
-                            "- 16 templates available, all using REAPER built-in plugins\n\n"
-                            "FREQUENCY CONFLICTS:\n"
-                            "- detect_frequency_conflicts finds masking between tracks\n"
-                            "- Suggests complementary EQ carving — cut on one track, boost on the other\n\n"
-                            "SIDECHAIN:\n"
-                            "- setup_sidechain creates routing + configures compressor/gate automatically\n"
-                            "- Common patterns: kick→bass (tight low end), vocal→music bus (ducking), kick→synth pad (pumping)\n\n"
-                            "MASTERING:\n"
-                            "- Use 'master' as the track name to target the master bus with any tool\n"
-                            "- Mastering chain order: EQ → multiband comp → glue comp → limiter\n"
-                            "- LUFS targets: Spotify/YouTube -14, Apple Music -16, broadcast -24, CD -9\n\n"
-                            "SESSION CLEANUP:\n"
-                            "- prepare_session removes empty tracks and creates standard buses\n"
-                            "- set_track_color for visual organization\n"
-                            "- Common color scheme: drums=red, bass=orange, guitars=green, vocals=blue, synths=purple, buses=grey"
-                        ),
-                    ),
-                )
-            ]
-        )
-
-    # -- Tool definitions --
-    TOOLS = [
-        Tool(
-            name="ping",
-            description=(
-                "Check if REAPER is connected and the listener is running. "
-                "Returns REAPER version, project name, and track count. "
-                "Use this to verify the connection before doing work."
-            ),
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="get_session_state",
-            description=(
-                "Get the full state of the current REAPER project. CALL THIS FIRST before "
-                "any other action to understand what tracks, FX, routing, and items exist. "
-                "Returns track names, volumes, pans, mute/solo state, FX chains with all "
-                "parameter names and current values, sends, items, markers, tempo, and "
-                "time signature."
-            ),
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        # Transport
-        Tool(
-            name="play",
-            description="Start playback in REAPER.",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="stop",
-            description="Stop playback in REAPER.",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="pause",
-            description="Pause playback in REAPER.",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="record",
-            description="Start recording in REAPER.",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="set_tempo",
-            description="Set the project tempo in BPM.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "bpm": {
-                        "type": "number",
-                        "description": "Tempo in beats per minute (1-960)",
-                    },
+REAPER_ASSISTANT_PROMPT = (
+    "You are connected to REAPER (a digital audio workstation) via MCP tools. "
+    "You can control the DAW through natural language.\n\n"
+    "WORKFLOW:\n"
+    "1. ALWAYS call get_session_state first to see what tracks, FX, routing, "
+    "and items exist in the project before making changes.\n"
+    "2. Use the tool results to understand the current state before acting.\n"
+    "3. When asked to do something, translate it into the appropriate tool calls.\n\n"
+    "CONVENTIONS:\n"
+    "- Track names use partial, case-insensitive matching ('vox' finds 'Vox Lead')\n"
+    "- Volume is in dB (0 = unity gain, -6 = half volume)\n"
+    "- Pan is -100 (full left) to 100 (full right)\n"
+    "- FX parameters: call get_fx_params first to see parameter names and ranges\n"
+    "- Everything you do is wrapped in undo blocks — the user can Ctrl+Z any action\n\n"
+    "METERING:\n"
+    "- Use get_track_meter / get_master_meter to check levels (playback must be running)\n"
+    "- Check for clipping before and after making changes\n\n"
+    "TIPS:\n"
+    "- For EQ: add ReaEQ, then use get_fx_params to find band parameters\n"
+    "- For compression: add ReaComp, check params for threshold/ratio/attack/release\n"
+    "- For sends/buses: create_track for the bus, then create_send from source tracks\n"
+    "- Don't know which plugin? Call list_installed_fx with a category filter\n"
+    "- For automation: add_envelope_points with 'Volume', 'Pan', or 'FXName:ParamName'\n"
+    "- For organization: create_folder to group tracks (e.g., all drums)\n"
+    "- For rendering: render_project uses REAPER's last format settings\n"
+    "- toggle_phase for multi-mic phase issues (kick, snare, DI/amp)\n"
+    "- You can chain multiple operations in sequence\n"
+    "- If a track name is ambiguous, the error will list the matches — ask the user to clarify\n\n"
+    "VIBE-BASED SOUND DESIGN:\n"
+    "When the user describes sounds with creative/vague terms, translate them into concrete FX.\n"
+    "- Call get_preferences FIRST to check for user plugin and style preferences\n"
+    "- Call get_session_state to see existing FX (don't duplicate)\n"
+    "- Use list_installed_fx to check for preferred or third-party plugins\n"
+    "- Use apply_fx_chain to apply multiple FX with params in a single call\n"
+    "- Multiple small moves > one big move (gentle EQ + light compression, not extreme settings)\n"
+    "- Always explain what you're doing and why\n"
+    "- When the user says 'I like X for Y' or 'always use X', call set_preference to save it\n\n"
+    "REAPER BUILT-IN PLUGIN PARAMETER REFERENCE:\n"
+    "Use these param names directly with apply_fx_chain (no need to call get_fx_params first):\n"
+    "- ReaEQ: 'Band N Freq', 'Band N Gain', 'Band N BW' (bandwidth), "
+    "'Band N Type' (0=band, 1=lowshelf, 2=highshelf, 3=highpass, 4=lowpass, 5=notch, "
+    "6=bandpass, 8=allpass), 'Band N Enabled' (where N = 1-8)\n"
+    "- ReaComp: 'Thresh' (dB, 0 to -60), 'Ratio', 'Attack' (ms), 'Release' (ms), "
+    "'Knee', 'Pre-Comp' (lookahead), 'Wet', 'Dry'\n"
+    "- ReaDelay: 'Length' (ms), 'Feedback', 'Wet', 'Dry', 'Lowpass', 'Highpass'\n"
+    "- ReaVerbate: 'Room Size', 'Dampening', 'Stereo Width', 'Wet', 'Dry', 'Initial Delay'\n"
+    "- ReaXcomp: multi-band compressor with per-band thresholds\n"
+    "- JS: Saturation: 'Drive', 'Output', 'Mix'\n\n"
+    "COMMON VIBES → FX TRANSLATION:\n"
+    "- 'warm' → gentle low-shelf boost (+2-3dB ~200-300Hz), slight HF rolloff, light saturation\n"
+    "- 'bright/airy' → high-shelf boost ~8-12kHz, slight presence boost 3-5kHz\n"
+    "- 'moist/lush' → chorus or short modulated delay, gentle reverb\n"
+    "- 'punchy' → compression with fast attack, medium release, moderate ratio\n"
+    "- 'spacious/wide' → stereo reverb, stereo delay, Haas effect\n"
+    "- 'crispy/gritty' → saturation/distortion, presence boost\n"
+    "- 'thick/fat' → low-mid boost, compression, maybe parallel compression\n"
+    "- 'clean' → remove or reduce existing FX, cut muddy frequencies\n"
+    "- 'tight' → compression with fast attack, gate for noise, cut low frequencies\n"
+    "- 'sparkle' → high-frequency shelf boost, exciter/saturation on highs\n"
+    "- 'muddy (fix)' → cut 200-500Hz, add clarity with high boost\n"
+    "- 'sit in the mix' → EQ to carve space, compression for dynamics, volume adjustment\n"
+    "- 'lo-fi' → bit reduction, tape saturation, bandpass filter, vinyl noise\n"
+    "- 'radio' → bandpass 300Hz-3kHz, light compression, subtle distortion\n"
+    "These are starting points — adjust based on context, instrument, and user preferences.\n\n"
+    "SPECTRAL ANALYSIS & LUFS METERING:\n"
+    "- Use analyze_track to get 5-band spectral energy, peak/RMS, and crest factor\n"
+    "- Use get_loudness for short-term/integrated LUFS and K-weighted RMS\n"
+    "- Playback MUST be running for live readings — warn the user if stopped\n"
+    "- The MCP Analyzer JSFX is added automatically (transparent, no audio modification)\n"
+    "- Use spectral data to make informed EQ decisions rather than guessing\n\n"
+    "MIX AUDIT:\n"
+    "- Run audit_mix to diagnose the entire project at once\n"
+    "- Fix errors first (clipping), then warnings (hot tracks, low headroom), then info\n"
+    "- Playback should be running for accurate level checks\n\n"
+    "GAIN STAGING:\n"
+    "- auto_gain_stage adjusts faders to target -18dBFS (or custom target)\n"
+    "- Must run during a representative loud section (chorus, drop)\n"
+    "- Only adjusts faders, not item gain — fully reversible with Ctrl+Z\n\n"
+    "INSTRUMENT TEMPLATES:\n"
+    "- get_instrument_templates returns EQ+compression presets for specific instruments\n"
+    "- Workflow: get_instrument_templates('vocals') → pass fx_chain to apply_fx_chain\n"
+    "- 16 templates available, all using REAPER built-in plugins\n\n"
+    "FREQUENCY CONFLICTS:\n"
+    "- detect_frequency_conflicts finds masking between tracks\n"
+    "- Suggests complementary EQ carving — cut on one track, boost on the other\n\n"
+    "SIDECHAIN:\n"
+    "- setup_sidechain creates routing + configures compressor/gate automatically\n"
+    "- Common patterns: kick→bass (tight low end), vocal→music bus (ducking), kick→synth pad (pumping)\n\n"
+    "MASTERING:\n"
+    "- Use 'master' as the track name to target the master bus with any tool\n"
+    "- Mastering chain order: EQ → multiband comp → glue comp → limiter\n"
+    "- LUFS targets: Spotify/YouTube -14, Apple Music -16, broadcast -24, CD -9\n\n"
+    "SESSION CLEANUP:\n"
+    "- prepare_session removes empty tracks and creates standard buses\n"
+    "- set_track_color for visual organization\n"
+    "- Common color scheme: drums=red, bass=orange, guitars=green, vocals=blue, synths=purple, buses=grey"
+)
+
+# Property schemas repeated across many tools; shared by reference.
+_TRACK_PROP = {"type": "string", "description": "Track name (partial match OK)"}
+_FX_PROP = {"type": "string", "description": "FX name (partial match OK)"}
+_ITEM_IDX_PROP = {"type": "integer", "description": "Item index on the track"}
+
+TOOL_SPECS = [
+    dict(
+        name="ping",
+        description=(
+            "Check if REAPER is connected and the listener is running. "
+            "Returns REAPER version, project name, and track count. "
+            "Use this to verify the connection before doing work."
+        ),
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    dict(
+        name="get_session_state",
+        description=(
+            "Get the full state of the current REAPER project. CALL THIS FIRST before "
+            "any other action to understand what tracks, FX, routing, and items exist. "
+            "Returns track names, volumes, pans, mute/solo state, FX chains with all "
+            "parameter names and current values, sends, items, markers, tempo, and "
+            "time signature."
+        ),
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    # Transport
+    dict(
+        name="play",
+        description="Start playback in REAPER.",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    dict(
+        name="stop",
+        description="Stop playback in REAPER.",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    dict(
+        name="pause",
+        description="Pause playback in REAPER.",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    dict(
+        name="record",
+        description="Start recording in REAPER.",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    dict(
+        name="set_tempo",
+        description="Set the project tempo in BPM.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "bpm": {
+                    "type": "number",
+                    "description": "Tempo in beats per minute (1-960)",
                 },
-                "required": ["bpm"],
             },
-        ),
-        Tool(
-            name="get_transport_state",
-            description="Get current transport state (playing, paused, recording, position, tempo).",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        # Tracks
-        Tool(
-            name="create_track",
-            description="Create a new track in the project.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string", "description": "Name for the new track"},
-                    "index": {
-                        "type": "integer",
-                        "description": "Insert position (0-based). Omit to add at end.",
-                    },
+            "required": ["bpm"],
+        },
+    ),
+    dict(
+        name="get_transport_state",
+        description="Get current transport state (playing, paused, recording, position, tempo).",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    # Tracks
+    dict(
+        name="create_track",
+        description="Create a new track in the project.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Name for the new track"},
+                "index": {
+                    "type": "integer",
+                    "description": "Insert position (0-based). Omit to add at end.",
                 },
-                "required": ["name"],
             },
-        ),
-        Tool(
-            name="delete_track",
-            description="Delete a track by name.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {
-                        "type": "string",
-                        "description": "Track name (case-insensitive, partial match OK)",
-                    },
+            "required": ["name"],
+        },
+    ),
+    dict(
+        name="delete_track",
+        description="Delete a track by name.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": {
+                    "type": "string",
+                    "description": "Track name (case-insensitive, partial match OK)",
                 },
-                "required": ["track"],
             },
-        ),
-        Tool(
-            name="rename_track",
-            description="Rename a track.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {"type": "string", "description": "Current track name (partial match OK)"},
-                    "new_name": {"type": "string", "description": "New name for the track"},
-                },
-                "required": ["track", "new_name"],
+            "required": ["track"],
+        },
+    ),
+    dict(
+        name="rename_track",
+        description="Rename a track.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": {"type": "string", "description": "Current track name (partial match OK)"},
+                "new_name": {"type": "string", "description": "New name for the track"},
             },
-        ),
-        Tool(
-            name="set_track_volume",
-            description="Set a track's volume in dB. 0 dB = unity gain.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {"type": "string", "description": "Track name (partial match OK)"},
-                    "db": {"type": "number", "description": "Volume in dB (e.g., -6, 0, +3)"},
-                },
-                "required": ["track", "db"],
+            "required": ["track", "new_name"],
+        },
+    ),
+    dict(
+        name="set_track_volume",
+        description="Set a track's volume in dB. 0 dB = unity gain.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": _TRACK_PROP,
+                "db": {"type": "number", "description": "Volume in dB (e.g., -6, 0, +3)"},
             },
-        ),
-        Tool(
-            name="set_track_pan",
-            description="Set a track's pan. -100 = full left, 0 = center, 100 = full right.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {"type": "string", "description": "Track name (partial match OK)"},
-                    "pan": {"type": "number", "description": "Pan position (-100 to 100)"},
-                },
-                "required": ["track", "pan"],
+            "required": ["track", "db"],
+        },
+    ),
+    dict(
+        name="set_track_pan",
+        description="Set a track's pan. -100 = full left, 0 = center, 100 = full right.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": _TRACK_PROP,
+                "pan": {"type": "number", "description": "Pan position (-100 to 100)"},
             },
-        ),
-        Tool(
-            name="mute_track",
-            description="Mute a track.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {"type": "string", "description": "Track name (partial match OK)"},
-                },
-                "required": ["track"],
+            "required": ["track", "pan"],
+        },
+    ),
+    dict(
+        name="mute_track",
+        description="Mute a track.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": _TRACK_PROP,
             },
-        ),
-        Tool(
-            name="unmute_track",
-            description="Unmute a track.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {"type": "string", "description": "Track name (partial match OK)"},
-                },
-                "required": ["track"],
+            "required": ["track"],
+        },
+    ),
+    dict(
+        name="unmute_track",
+        description="Unmute a track.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": _TRACK_PROP,
             },
-        ),
-        Tool(
-            name="solo_track",
-            description="Solo a track.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {"type": "string", "description": "Track name (partial match OK)"},
-                },
-                "required": ["track"],
+            "required": ["track"],
+        },
+    ),
+    dict(
+        name="solo_track",
+        description="Solo a track.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": _TRACK_PROP,
             },
-        ),
-        Tool(
-            name="unsolo_track",
-            description="Unsolo a track.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {"type": "string", "description": "Track name (partial match OK)"},
-                },
-                "required": ["track"],
+            "required": ["track"],
+        },
+    ),
+    dict(
+        name="unsolo_track",
+        description="Unsolo a track.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": _TRACK_PROP,
             },
-        ),
-        Tool(
-            name="arm_track",
-            description="Arm a track for recording.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {"type": "string", "description": "Track name (partial match OK)"},
-                },
-                "required": ["track"],
+            "required": ["track"],
+        },
+    ),
+    dict(
+        name="arm_track",
+        description="Arm a track for recording.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": _TRACK_PROP,
             },
-        ),
-        Tool(
-            name="unarm_track",
-            description="Disarm a track (stop record arm).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {"type": "string", "description": "Track name (partial match OK)"},
-                },
-                "required": ["track"],
+            "required": ["track"],
+        },
+    ),
+    dict(
+        name="unarm_track",
+        description="Disarm a track (stop record arm).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": _TRACK_PROP,
             },
-        ),
-        # FX
-        Tool(
-            name="list_installed_fx",
-            description=(
-                "List FX plugins installed on the system. Use this when the user asks to "
-                "add an effect but doesn't specify which plugin — call this to see what's "
-                "available and either pick the best match or ask the user to choose. "
-                "Supports filtering by name and by category (eq, compressor, reverb, delay, "
-                "distortion, limiter, gate, chorus)."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filter": {
-                        "type": "string",
-                        "description": "Search string to filter plugin names (e.g., 'SSL', 'Fab')",
-                    },
-                    "category": {
-                        "type": "string",
-                        "description": "Filter by type: eq, compressor, reverb, delay, distortion, limiter, gate, chorus",
-                        "enum": ["eq", "compressor", "reverb", "delay", "distortion", "limiter", "gate", "chorus"],
-                    },
+            "required": ["track"],
+        },
+    ),
+    # FX
+    dict(
+        name="list_installed_fx",
+        description=(
+            "List FX plugins installed on the system. Use this when the user asks to "
+            "add an effect but doesn't specify which plugin — call this to see what's "
+            "available and either pick the best match or ask the user to choose. "
+            "Supports filtering by name and by category (eq, compressor, reverb, delay, "
+            "distortion, limiter, gate, chorus)."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filter": {
+                    "type": "string",
+                    "description": "Search string to filter plugin names (e.g., 'SSL', 'Fab')",
                 },
-            },
-        ),
-        Tool(
-            name="add_fx",
-            description=(
-                "Add an FX plugin to a track. Uses REAPER's FX browser search, so partial "
-                "names work (e.g., 'ReaEQ', 'ReaComp', 'ReaDelay'). If the user doesn't "
-                "specify a plugin, call list_installed_fx first to see what's available."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {"type": "string", "description": "Track name (partial match OK)"},
-                    "plugin_name": {
-                        "type": "string",
-                        "description": "Plugin name (e.g., 'ReaEQ', 'ReaComp')",
-                    },
+                "category": {
+                    "type": "string",
+                    "description": "Filter by type: eq, compressor, reverb, delay, distortion, limiter, gate, chorus",
+                    "enum": ["eq", "compressor", "reverb", "delay", "distortion", "limiter", "gate", "chorus"],
                 },
-                "required": ["track", "plugin_name"],
             },
-        ),
-        Tool(
-            name="remove_fx",
-            description="Remove an FX plugin from a track by name or index.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {"type": "string", "description": "Track name (partial match OK)"},
-                    "fx": {"type": "string", "description": "FX name (partial match OK) or index"},
+        },
+    ),
+    dict(
+        name="add_fx",
+        description=(
+            "Add an FX plugin to a track. Uses REAPER's FX browser search, so partial "
+            "names work (e.g., 'ReaEQ', 'ReaComp', 'ReaDelay'). If the user doesn't "
+            "specify a plugin, call list_installed_fx first to see what's available."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": _TRACK_PROP,
+                "plugin_name": {
+                    "type": "string",
+                    "description": "Plugin name (e.g., 'ReaEQ', 'ReaComp')",
                 },
-                "required": ["track", "fx"],
             },
-        ),
-        Tool(
-            name="get_fx_params",
-            description=(
-                "Get all parameters of an FX plugin with current values and ranges. "
-                "Call this before set_fx_param to discover parameter names and valid ranges."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {"type": "string", "description": "Track name (partial match OK)"},
-                    "fx": {"type": "string", "description": "FX name (partial match OK)"},
-                },
-                "required": ["track", "fx"],
+            "required": ["track", "plugin_name"],
+        },
+    ),
+    dict(
+        name="remove_fx",
+        description="Remove an FX plugin from a track by name or index.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": _TRACK_PROP,
+                "fx": {"type": "string", "description": "FX name (partial match OK) or index"},
             },
-        ),
-        Tool(
-            name="set_fx_param",
-            description=(
-                "Set a parameter on an FX plugin. Parameter names are matched fuzzily. "
-                "Use get_fx_params first to find parameter names and value ranges."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {"type": "string", "description": "Track name (partial match OK)"},
-                    "fx": {"type": "string", "description": "FX name (partial match OK)"},
-                    "param": {"type": "string", "description": "Parameter name (fuzzy match)"},
-                    "value": {"type": "number", "description": "Value (check get_fx_params for range)"},
-                },
-                "required": ["track", "fx", "param", "value"],
+            "required": ["track", "fx"],
+        },
+    ),
+    dict(
+        name="get_fx_params",
+        description=(
+            "Get all parameters of an FX plugin with current values and ranges. "
+            "Call this before set_fx_param to discover parameter names and valid ranges."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": _TRACK_PROP,
+                "fx": _FX_PROP,
             },
-        ),
-        Tool(
-            name="bypass_fx",
-            description="Bypass (disable) an FX plugin on a track.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {"type": "string", "description": "Track name (partial match OK)"},
-                    "fx": {"type": "string", "description": "FX name (partial match OK)"},
-                },
-                "required": ["track", "fx"],
+            "required": ["track", "fx"],
+        },
+    ),
+    dict(
+        name="set_fx_param",
+        description=(
+            "Set a parameter on an FX plugin. Parameter names are matched fuzzily. "
+            "Use get_fx_params first to find parameter names and value ranges."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": _TRACK_PROP,
+                "fx": _FX_PROP,
+                "param": {"type": "string", "description": "Parameter name (fuzzy match)"},
+                "value": {"type": "number", "description": "Value (check get_fx_params for range)"},
             },
-        ),
-        Tool(
-            name="enable_fx",
-            description="Enable (un-bypass) an FX plugin on a track.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {"type": "string", "description": "Track name (partial match OK)"},
-                    "fx": {"type": "string", "description": "FX name (partial match OK)"},
-                },
-                "required": ["track", "fx"],
+            "required": ["track", "fx", "param", "value"],
+        },
+    ),
+    dict(
+        name="bypass_fx",
+        description="Bypass (disable) an FX plugin on a track.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": _TRACK_PROP,
+                "fx": _FX_PROP,
             },
-        ),
-        Tool(
-            name="apply_fx_chain",
-            description=(
-                "Add multiple FX plugins to a track with pre-configured parameters in a single operation. "
-                "Use this for applying complete effect chains — especially when interpreting creative/vibe-based "
-                "sound descriptions. All FX are added in one undo block (Ctrl+Z reverts everything). "
-                "Parameter names are fuzzy-matched. Values are clamped to plugin ranges."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {"type": "string", "description": "Track name (partial match OK)"},
-                    "fx_chain": {
-                        "type": "array",
-                        "description": "FX plugins to add with parameter settings",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "plugin": {"type": "string", "description": "Plugin name (e.g., 'ReaEQ')"},
-                                "params": {
-                                    "type": "object",
-                                    "description": "Parameter name → value pairs",
-                                    "additionalProperties": {"type": "number"},
-                                },
+            "required": ["track", "fx"],
+        },
+    ),
+    dict(
+        name="enable_fx",
+        description="Enable (un-bypass) an FX plugin on a track.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": _TRACK_PROP,
+                "fx": _FX_PROP,
+            },
+            "required": ["track", "fx"],
+        },
+    ),
+    dict(
+        name="apply_fx_chain",
+        description=(
+            "Add multiple FX plugins to a track with pre-configured parameters in a single operation. "
+            "Use this for applying complete effect chains — especially when interpreting creative/vibe-based "
+            "sound descriptions. All FX are added in one undo block (Ctrl+Z reverts everything). "
+            "Parameter names are fuzzy-matched. Values are clamped to plugin ranges."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": _TRACK_PROP,
+                "fx_chain": {
+                    "type": "array",
+                    "description": "FX plugins to add with parameter settings",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "plugin": {"type": "string", "description": "Plugin name (e.g., 'ReaEQ')"},
+                            "params": {
+                                "type": "object",
+                                "description": "Parameter name → value pairs",
+                                "additionalProperties": {"type": "number"},
                             },
-                            "required": ["plugin"],
                         },
+                        "required": ["plugin"],
                     },
                 },
-                "required": ["track", "fx_chain"],
             },
-        ),
-        # Routing
-        Tool(
-            name="create_send",
-            description="Create a send from one track to another (bus routing, parallel processing).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "source": {"type": "string", "description": "Source track name"},
-                    "dest": {"type": "string", "description": "Destination track name"},
-                    "volume_db": {"type": "number", "description": "Send volume in dB (default 0)"},
-                },
-                "required": ["source", "dest"],
+            "required": ["track", "fx_chain"],
+        },
+    ),
+    # Routing
+    dict(
+        name="create_send",
+        description="Create a send from one track to another (bus routing, parallel processing).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "source": {"type": "string", "description": "Source track name"},
+                "dest": {"type": "string", "description": "Destination track name"},
+                "volume_db": {"type": "number", "description": "Send volume in dB (default 0)"},
             },
-        ),
-        Tool(
-            name="remove_send",
-            description="Remove a send between two tracks.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "source": {"type": "string", "description": "Source track name"},
-                    "dest": {"type": "string", "description": "Destination track name"},
-                },
-                "required": ["source", "dest"],
+            "required": ["source", "dest"],
+        },
+    ),
+    dict(
+        name="remove_send",
+        description="Remove a send between two tracks.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "source": {"type": "string", "description": "Source track name"},
+                "dest": {"type": "string", "description": "Destination track name"},
             },
-        ),
-        Tool(
-            name="set_send_volume",
-            description="Set the volume of an existing send between two tracks.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "source": {"type": "string", "description": "Source track name"},
-                    "dest": {"type": "string", "description": "Destination track name"},
-                    "db": {"type": "number", "description": "Send volume in dB"},
-                },
-                "required": ["source", "dest", "db"],
+            "required": ["source", "dest"],
+        },
+    ),
+    dict(
+        name="set_send_volume",
+        description="Set the volume of an existing send between two tracks.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "source": {"type": "string", "description": "Source track name"},
+                "dest": {"type": "string", "description": "Destination track name"},
+                "db": {"type": "number", "description": "Send volume in dB"},
             },
-        ),
-        # Items & MIDI
-        Tool(
-            name="create_midi_item",
-            description="Create an empty MIDI item on a track.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {"type": "string", "description": "Track name (partial match OK)"},
-                    "start_beat": {"type": "number", "description": "Start position in beats"},
-                    "length_beats": {"type": "number", "description": "Length in beats"},
-                },
-                "required": ["track", "start_beat", "length_beats"],
+            "required": ["source", "dest", "db"],
+        },
+    ),
+    # Items & MIDI
+    dict(
+        name="create_midi_item",
+        description="Create an empty MIDI item on a track.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": _TRACK_PROP,
+                "start_beat": {"type": "number", "description": "Start position in beats"},
+                "length_beats": {"type": "number", "description": "Length in beats"},
             },
-        ),
-        Tool(
-            name="insert_midi_notes",
-            description=(
-                "Insert MIDI notes into a MIDI item. Each note needs pitch (0-127, "
-                "60 = middle C), start_beat, and length_beats. Velocity defaults to 100."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {"type": "string", "description": "Track name (partial match OK)"},
-                    "item_index": {"type": "integer", "description": "MIDI item index (default 0)"},
-                    "notes": {
-                        "type": "array",
-                        "description": "Notes to insert",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "pitch": {"type": "integer", "description": "MIDI note (0-127, 60=C4)"},
-                                "velocity": {"type": "integer", "description": "Velocity (1-127, default 100)"},
-                                "start_beat": {"type": "number", "description": "Start in beats"},
-                                "length_beats": {"type": "number", "description": "Duration in beats"},
-                                "channel": {"type": "integer", "description": "MIDI channel (1-16, default 1)"},
-                            },
-                            "required": ["pitch", "start_beat", "length_beats"],
+            "required": ["track", "start_beat", "length_beats"],
+        },
+    ),
+    dict(
+        name="insert_midi_notes",
+        description=(
+            "Insert MIDI notes into a MIDI item. Each note needs pitch (0-127, "
+            "60 = middle C), start_beat, and length_beats. Velocity defaults to 100."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": _TRACK_PROP,
+                "item_index": {"type": "integer", "description": "MIDI item index (default 0)"},
+                "notes": {
+                    "type": "array",
+                    "description": "Notes to insert (max 10000 per call)",
+                    "maxItems": 10000,
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "pitch": {"type": "integer", "description": "MIDI note (0-127, 60=C4)"},
+                            "velocity": {"type": "integer", "description": "Velocity (1-127, default 100)"},
+                            "start_beat": {"type": "number", "description": "Start in beats"},
+                            "length_beats": {"type": "number", "description": "Duration in beats"},
+                            "channel": {"type": "integer", "description": "MIDI channel (1-16, default 1)"},
                         },
+                        "required": ["pitch", "start_beat", "length_beats"],
                     },
                 },
-                "required": ["track", "notes"],
             },
-        ),
-        Tool(
-            name="delete_item",
-            description="Delete a media item from a track by index.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {"type": "string", "description": "Track name (partial match OK)"},
-                    "item_index": {"type": "integer", "description": "Item index on the track"},
-                },
-                "required": ["track", "item_index"],
+            "required": ["track", "notes"],
+        },
+    ),
+    dict(
+        name="delete_item",
+        description="Delete a media item from a track by index.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": _TRACK_PROP,
+                "item_index": _ITEM_IDX_PROP,
             },
-        ),
-        Tool(
-            name="move_item",
-            description="Move a media item to a new position in seconds.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {"type": "string", "description": "Track name (partial match OK)"},
-                    "item_index": {"type": "integer", "description": "Item index on the track"},
-                    "position": {"type": "number", "description": "New position in seconds"},
-                },
-                "required": ["track", "item_index", "position"],
+            "required": ["track", "item_index"],
+        },
+    ),
+    dict(
+        name="move_item",
+        description="Move a media item to a new position in seconds.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": _TRACK_PROP,
+                "item_index": _ITEM_IDX_PROP,
+                "position": {"type": "number", "description": "New position in seconds"},
             },
-        ),
-        Tool(
-            name="split_item_at",
-            description="Split a media item at a position in seconds.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {"type": "string", "description": "Track name (partial match OK)"},
-                    "item_index": {"type": "integer", "description": "Item index on the track"},
-                    "position": {"type": "number", "description": "Split position in seconds"},
-                },
-                "required": ["track", "item_index", "position"],
+            "required": ["track", "item_index", "position"],
+        },
+    ),
+    dict(
+        name="split_item_at",
+        description="Split a media item at a position in seconds.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": _TRACK_PROP,
+                "item_index": _ITEM_IDX_PROP,
+                "position": {"type": "number", "description": "Split position in seconds"},
             },
-        ),
-        # Markers & Regions
-        Tool(
-            name="add_marker",
-            description="Add a project marker at a position in seconds.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "position": {"type": "number", "description": "Position in seconds (default: edit cursor)"},
-                    "name": {"type": "string", "description": "Marker name"},
-                },
+            "required": ["track", "item_index", "position"],
+        },
+    ),
+    # Markers & Regions
+    dict(
+        name="add_marker",
+        description="Add a project marker at a position in seconds.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "position": {"type": "number", "description": "Position in seconds (default: edit cursor)"},
+                "name": {"type": "string", "description": "Marker name"},
             },
-        ),
-        Tool(
-            name="add_region",
-            description="Add a project region between two positions in seconds.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "start": {"type": "number", "description": "Region start in seconds"},
-                    "finish": {"type": "number", "description": "Region end in seconds"},
-                    "name": {"type": "string", "description": "Region name"},
-                },
-                "required": ["start", "finish"],
+        },
+    ),
+    dict(
+        name="add_region",
+        description="Add a project region between two positions in seconds.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "start": {"type": "number", "description": "Region start in seconds"},
+                "finish": {"type": "number", "description": "Region end in seconds"},
+                "name": {"type": "string", "description": "Region name"},
             },
-        ),
-        # Undo/Redo
-        Tool(
-            name="undo",
-            description="Undo the last action in REAPER (Ctrl+Z).",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="redo",
-            description="Redo the last undone action in REAPER (Ctrl+Shift+Z).",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        # -- Metering / Analysis --
-        Tool(
-            name="get_track_meter",
-            description=(
-                "Read the current peak level of a track in dB. Use this to check levels, "
-                "detect clipping, or compare loudness between tracks. Returns left/right "
-                "peak values and a clipping flag. Playback must be running for live readings."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {"type": "string", "description": "Track name (partial match OK)"},
-                },
-                "required": ["track"],
+            "required": ["start", "finish"],
+        },
+    ),
+    # Undo/Redo
+    dict(
+        name="undo",
+        description="Undo the last action in REAPER (Ctrl+Z).",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    dict(
+        name="redo",
+        description="Redo the last undone action in REAPER (Ctrl+Shift+Z).",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    # -- Metering / Analysis --
+    dict(
+        name="get_track_meter",
+        description=(
+            "Read the current peak level of a track in dB. Use this to check levels, "
+            "detect clipping, or compare loudness between tracks. Returns left/right "
+            "peak values and a clipping flag. Playback must be running for live readings."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": _TRACK_PROP,
             },
-        ),
-        Tool(
-            name="get_master_meter",
-            description=(
-                "Read the current peak level of the master bus in dB. Use to check if the "
-                "mix is clipping or to gauge overall loudness. Playback must be running."
-            ),
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        # -- Render / Bounce --
-        Tool(
-            name="render_project",
-            description=(
-                "Render/bounce the project to an audio file. Uses REAPER's most recent "
-                "render format settings (WAV, MP3, etc. — whatever the user last configured). "
-                "You can set the output directory, filename, bounds, and sample rate."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "directory": {
-                        "type": "string",
-                        "description": "Output directory path. Omit to use REAPER's current setting.",
-                    },
-                    "filename": {
-                        "type": "string",
-                        "description": "Filename pattern (e.g., 'mix_v2'). Omit for default.",
-                    },
-                    "bounds": {
-                        "type": "string",
-                        "description": "What to render: 'project' (entire), 'time_selection', or 'custom'",
-                        "enum": ["project", "time_selection", "custom"],
-                    },
-                    "start_time": {
-                        "type": "number",
-                        "description": "Start time in seconds (only with bounds='custom')",
-                    },
-                    "end_time": {
-                        "type": "number",
-                        "description": "End time in seconds (only with bounds='custom')",
-                    },
-                    "sample_rate": {
-                        "type": "integer",
-                        "description": "Sample rate in Hz (e.g., 44100, 48000, 96000)",
-                    },
-                    "channels": {
-                        "type": "integer",
-                        "description": "Number of channels (1=mono, 2=stereo)",
-                    },
+            "required": ["track"],
+        },
+    ),
+    dict(
+        name="get_master_meter",
+        description=(
+            "Read the current peak level of the master bus in dB. Use to check if the "
+            "mix is clipping or to gauge overall loudness. Playback must be running."
+        ),
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    # -- Render / Bounce --
+    dict(
+        name="render_project",
+        description=(
+            "Render/bounce the project to an audio file. Uses REAPER's most recent "
+            "render format settings (WAV, MP3, etc. — whatever the user last configured). "
+            "You can set the output directory, filename, bounds, and sample rate."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "directory": {
+                    "type": "string",
+                    "description": "Output directory path. Omit to use REAPER's current setting.",
+                },
+                "filename": {
+                    "type": "string",
+                    "description": "Filename pattern (e.g., 'mix_v2'). Omit for default.",
+                },
+                "bounds": {
+                    "type": "string",
+                    "description": "What to render: 'project' (entire), 'time_selection', or 'custom'",
+                    "enum": ["project", "time_selection", "custom"],
+                },
+                "start_time": {
+                    "type": "number",
+                    "description": "Start time in seconds (only with bounds='custom')",
+                },
+                "end_time": {
+                    "type": "number",
+                    "description": "End time in seconds (only with bounds='custom')",
+                },
+                "sample_rate": {
+                    "type": "integer",
+                    "description": "Sample rate in Hz (e.g., 44100, 48000, 96000)",
+                },
+                "channels": {
+                    "type": "integer",
+                    "description": "Number of channels (1=mono, 2=stereo)",
                 },
             },
-        ),
-        # -- Automation / Envelopes --
-        Tool(
-            name="add_envelope_points",
-            description=(
-                "Add automation points to a track envelope. Envelope can be 'Volume', "
-                "'Pan', 'Mute', or an FX parameter as 'FXName:ParamName' (e.g., "
-                "'ReaEQ:Frequency'). Volume values are in dB, pan in -100..100. "
-                "Shapes: 0=linear, 1=square, 2=S-curve, 3=fast start, 4=fast end, 5=bezier."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {"type": "string", "description": "Track name (partial match OK)"},
-                    "envelope": {
-                        "type": "string",
-                        "description": "Envelope name: 'Volume', 'Pan', 'Mute', or 'FXName:ParamName'",
-                    },
-                    "points": {
-                        "type": "array",
-                        "description": "Automation points to add",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "time": {"type": "number", "description": "Position in seconds"},
-                                "value": {
-                                    "type": "number",
-                                    "description": "Value (dB for Volume, -100..100 for Pan, raw for FX params)",
-                                },
-                                "shape": {
-                                    "type": "integer",
-                                    "description": "Curve shape (0=linear, 1=square, 2=S-curve, default 0)",
-                                },
+        },
+    ),
+    # -- Automation / Envelopes --
+    dict(
+        name="add_envelope_points",
+        description=(
+            "Add automation points to a track envelope. Envelope can be 'Volume', "
+            "'Pan', 'Mute', or an FX parameter as 'FXName:ParamName' (e.g., "
+            "'ReaEQ:Frequency'). Volume values are in dB, pan in -100..100. "
+            "Shapes: 0=linear, 1=square, 2=S-curve, 3=fast start, 4=fast end, 5=bezier."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": _TRACK_PROP,
+                "envelope": {
+                    "type": "string",
+                    "description": "Envelope name: 'Volume', 'Pan', 'Mute', or 'FXName:ParamName'",
+                },
+                "points": {
+                    "type": "array",
+                    "description": "Automation points to add",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "time": {"type": "number", "description": "Position in seconds"},
+                            "value": {
+                                "type": "number",
+                                "description": "Value (dB for Volume, -100..100 for Pan, raw for FX params)",
+                            },
+                            "shape": {
+                                "type": "integer",
+                                "description": "Curve shape (0=linear, 1=square, 2=S-curve, default 0)",
                             },
-                            "required": ["time", "value"],
                         },
+                        "required": ["time", "value"],
                     },
                 },
-                "required": ["track", "envelope", "points"],
             },
-        ),
-        Tool(
-            name="get_envelope_points",
-            description=(
-                "Read existing automation points from a track envelope. Returns time, "
-                "value, and shape for each point. Use to understand existing automation "
-                "before adding or modifying points."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {"type": "string", "description": "Track name (partial match OK)"},
-                    "envelope": {
-                        "type": "string",
-                        "description": "Envelope name: 'Volume', 'Pan', 'Mute', or 'FXName:ParamName'",
-                    },
-                    "start_time": {"type": "number", "description": "Filter: start time in seconds"},
-                    "end_time": {"type": "number", "description": "Filter: end time in seconds"},
+            "required": ["track", "envelope", "points"],
+        },
+    ),
+    dict(
+        name="get_envelope_points",
+        description=(
+            "Read existing automation points from a track envelope. Returns time, "
+            "value, and shape for each point. Use to understand existing automation "
+            "before adding or modifying points."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": _TRACK_PROP,
+                "envelope": {
+                    "type": "string",
+                    "description": "Envelope name: 'Volume', 'Pan', 'Mute', or 'FXName:ParamName'",
                 },
-                "required": ["track", "envelope"],
+                "start_time": {"type": "number", "description": "Filter: start time in seconds"},
+                "end_time": {"type": "number", "description": "Filter: end time in seconds"},
             },
-        ),
-        Tool(
-            name="clear_envelope",
-            description=(
-                "Clear automation points from a track envelope. Optionally specify a time "
-                "range to clear only points within that range."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {"type": "string", "description": "Track name (partial match OK)"},
-                    "envelope": {
-                        "type": "string",
-                        "description": "Envelope name: 'Volume', 'Pan', 'Mute', or 'FXName:ParamName'",
-                    },
-                    "start_time": {"type": "number", "description": "Start of range to clear (seconds)"},
-                    "end_time": {"type": "number", "description": "End of range to clear (seconds)"},
+            "required": ["track", "envelope"],
+        },
+    ),
+    dict(
+        name="clear_envelope",
+        description=(
+            "Clear automation points from a track envelope. Optionally specify a time "
+            "range to clear only points within that range."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": _TRACK_PROP,
+                "envelope": {
+                    "type": "string",
+                    "description": "Envelope name: 'Volume', 'Pan', 'Mute', or 'FXName:ParamName'",
                 },
-                "required": ["track", "envelope"],
+                "start_time": {"type": "number", "description": "Start of range to clear (seconds)"},
+                "end_time": {"type": "number", "description": "End of range to clear (seconds)"},
             },
-        ),
-        # -- Track Folders / Grouping --
-        Tool(
-            name="create_folder",
-            description=(
-                "Create a folder track and move specified child tracks into it. "
-                "Use for organizing tracks into groups (e.g., all drums under a 'Drums' folder)."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string", "description": "Folder track name"},
-                    "children": {
-                        "type": "array",
-                        "description": "Track names to put inside the folder",
-                        "items": {"type": "string"},
-                    },
+            "required": ["track", "envelope"],
+        },
+    ),
+    # -- Track Folders / Grouping --
+    dict(
+        name="create_folder",
+        description=(
+            "Create a folder track and move specified child tracks into it. "
+            "Use for organizing tracks into groups (e.g., all drums under a 'Drums' folder)."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Folder track name"},
+                "children": {
+                    "type": "array",
+                    "description": "Track names to put inside the folder",
+                    "items": {"type": "string"},
                 },
-                "required": ["name", "children"],
             },
-        ),
-        # -- Item Gain & Fades --
-        Tool(
-            name="set_item_gain",
-            description="Set the gain (volume) of a media item in dB.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {"type": "string", "description": "Track name (partial match OK)"},
-                    "item_index": {"type": "integer", "description": "Item index on the track (default 0)"},
-                    "gain_db": {"type": "number", "description": "Gain in dB (0 = unity)"},
-                },
-                "required": ["track", "gain_db"],
+            "required": ["name", "children"],
+        },
+    ),
+    # -- Item Gain & Fades --
+    dict(
+        name="set_item_gain",
+        description="Set the gain (volume) of a media item in dB.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": _TRACK_PROP,
+                "item_index": {"type": "integer", "description": "Item index on the track (default 0)"},
+                "gain_db": {"type": "number", "description": "Gain in dB (0 = unity)"},
             },
-        ),
-        Tool(
-            name="set_item_fade_in",
-            description=(
-                "Set the fade-in on a media item. Shapes: 0=linear, 1=exponential, "
-                "2=S-curve, 3=exponential (alt), 4=fast start, 5=fast end, 6=bezier."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {"type": "string", "description": "Track name (partial match OK)"},
-                    "item_index": {"type": "integer", "description": "Item index on the track (default 0)"},
-                    "length": {"type": "number", "description": "Fade-in length in seconds"},
-                    "shape": {"type": "integer", "description": "Fade shape (0-6, default 0=linear)"},
-                },
-                "required": ["track", "length"],
+            "required": ["track", "gain_db"],
+        },
+    ),
+    dict(
+        name="set_item_fade_in",
+        description=(
+            "Set the fade-in on a media item. Shapes: 0=linear, 1=exponential, "
+            "2=S-curve, 3=exponential (alt), 4=fast start, 5=fast end, 6=bezier."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": _TRACK_PROP,
+                "item_index": {"type": "integer", "description": "Item index on the track (default 0)"},
+                "length": {"type": "number", "description": "Fade-in length in seconds"},
+                "shape": {"type": "integer", "description": "Fade shape (0-6, default 0=linear)"},
             },
-        ),
-        Tool(
-            name="set_item_fade_out",
-            description=(
-                "Set the fade-out on a media item. Shapes: 0=linear, 1=exponential, "
-                "2=S-curve, 3=exponential (alt), 4=fast start, 5=fast end, 6=bezier."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {"type": "string", "description": "Track name (partial match OK)"},
-                    "item_index": {"type": "integer", "description": "Item index on the track (default 0)"},
-                    "length": {"type": "number", "description": "Fade-out length in seconds"},
-                    "shape": {"type": "integer", "description": "Fade shape (0-6, default 0=linear)"},
-                },
-                "required": ["track", "length"],
+            "required": ["track", "length"],
+        },
+    ),
+    dict(
+        name="set_item_fade_out",
+        description=(
+            "Set the fade-out on a media item. Shapes: 0=linear, 1=exponential, "
+            "2=S-curve, 3=exponential (alt), 4=fast start, 5=fast end, 6=bezier."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": _TRACK_PROP,
+                "item_index": {"type": "integer", "description": "Item index on the track (default 0)"},
+                "length": {"type": "number", "description": "Fade-out length in seconds"},
+                "shape": {"type": "integer", "description": "Fade shape (0-6, default 0=linear)"},
             },
-        ),
-        # -- Cursor & Time Selection --
-        Tool(
-            name="set_cursor_position",
-            description="Move the edit cursor to a position in seconds.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "time": {"type": "number", "description": "Position in seconds from project start"},
-                },
-                "required": ["time"],
+            "required": ["track", "length"],
+        },
+    ),
+    # -- Cursor & Time Selection --
+    dict(
+        name="set_cursor_position",
+        description="Move the edit cursor to a position in seconds.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "time": {"type": "number", "description": "Position in seconds from project start"},
             },
-        ),
-        Tool(
-            name="set_time_selection",
-            description="Set the time selection (highlighted region) in REAPER.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "start_time": {"type": "number", "description": "Selection start in seconds"},
-                    "end_time": {"type": "number", "description": "Selection end in seconds"},
-                },
-                "required": ["start_time", "end_time"],
+            "required": ["time"],
+        },
+    ),
+    dict(
+        name="set_time_selection",
+        description="Set the time selection (highlighted region) in REAPER.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "start_time": {"type": "number", "description": "Selection start in seconds"},
+                "end_time": {"type": "number", "description": "Selection end in seconds"},
             },
-        ),
-        Tool(
-            name="set_loop_points",
-            description="Set the loop region and optionally enable/disable looping.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "start_time": {"type": "number", "description": "Loop start in seconds"},
-                    "end_time": {"type": "number", "description": "Loop end in seconds"},
-                    "enable": {"type": "boolean", "description": "Enable (true) or disable (false) repeat/loop"},
-                },
-                "required": ["start_time", "end_time"],
+            "required": ["start_time", "end_time"],
+        },
+    ),
+    dict(
+        name="set_loop_points",
+        description="Set the loop region and optionally enable/disable looping.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "start_time": {"type": "number", "description": "Loop start in seconds"},
+                "end_time": {"type": "number", "description": "Loop end in seconds"},
+                "enable": {"type": "boolean", "description": "Enable (true) or disable (false) repeat/loop"},
             },
-        ),
-        Tool(
-            name="go_to_marker",
-            description="Jump the edit cursor to a marker or region by name or index number.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "marker": {
-                        "type": "string",
-                        "description": "Marker name (partial match) or index number",
-                    },
+            "required": ["start_time", "end_time"],
+        },
+    ),
+    dict(
+        name="go_to_marker",
+        description="Jump the edit cursor to a marker or region by name or index number.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "marker": {
+                    "type": "string",
+                    "description": "Marker name (partial match) or index number",
                 },
-                "required": ["marker"],
             },
-        ),
-        # -- Phase --
-        Tool(
-            name="toggle_phase",
-            description=(
-                "Flip the polarity (phase) of a track. Essential for multi-mic setups "
-                "(kick in/out, snare top/bottom, DI vs amp)."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {"type": "string", "description": "Track name (partial match OK)"},
-                },
-                "required": ["track"],
+            "required": ["marker"],
+        },
+    ),
+    # -- Phase --
+    dict(
+        name="toggle_phase",
+        description=(
+            "Flip the polarity (phase) of a track. Essential for multi-mic setups "
+            "(kick in/out, snare top/bottom, DI vs amp)."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": _TRACK_PROP,
             },
-        ),
-        # -- User preferences (handled locally, not routed to REAPER) --
-        Tool(
-            name="set_preference",
-            description=(
-                "Save a user mixing preference that persists across sessions. Use for plugin "
-                "preferences (e.g., 'compressor_plugin' → 'FabFilter Pro-C 2'), mixing style notes, or "
-                "custom vibe definitions. Call this when the user expresses a preference."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "key": {
-                        "type": "string",
-                        "description": "Preference key (e.g., 'compressor_plugin', 'style', 'moist_means')",
-                    },
-                    "value": {
-                        "type": "string",
-                        "description": "Preference value",
-                    },
+            "required": ["track"],
+        },
+    ),
+    # -- User preferences (handled locally, not routed to REAPER) --
+    dict(
+        name="set_preference",
+        description=(
+            "Save a user mixing preference that persists across sessions. Use for plugin "
+            "preferences (e.g., 'compressor_plugin' → 'FabFilter Pro-C 2'), mixing style notes, or "
+            "custom vibe definitions. Call this when the user expresses a preference."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "key": {
+                    "type": "string",
+                    "description": "Preference key (e.g., 'compressor_plugin', 'style', 'moist_means')",
+                },
+                "value": {
+                    "type": "string",
+                    "description": "Preference value",
                 },
-                "required": ["key", "value"],
             },
-        ),
-        Tool(
-            name="get_preferences",
-            description=(
-                "Get all saved user mixing preferences. Call this before interpreting vibe-based "
-                "requests to respect the user's plugin and style preferences."
-            ),
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        # -- Analysis & Metering --
-        Tool(
-            name="analyze_track",
-            description=(
-                "Get spectral analysis of a track — 5-band energy (sub/low/mid/high-mid/high), "
-                "peak levels, RMS levels, and crest factor. Requires playback to be running. "
-                "Automatically adds the MCP Analyzer JSFX if not present (transparent — does not "
-                "modify audio). Use this to diagnose frequency balance, identify problem areas, "
-                "and make informed EQ decisions."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {
-                        "type": "string",
-                        "description": "Track name (or 'master' for master bus)",
-                    },
+            "required": ["key", "value"],
+        },
+    ),
+    dict(
+        name="get_preferences",
+        description=(
+            "Get all saved user mixing preferences. Call this before interpreting vibe-based "
+            "requests to respect the user's plugin and style preferences."
+        ),
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    # -- Analysis & Metering --
+    dict(
+        name="analyze_track",
+        description=(
+            "Get spectral analysis of a track — 5-band energy (sub/low/mid/high-mid/high), "
+            "peak levels, RMS levels, and crest factor. Requires playback to be running. "
+            "Automatically adds the MCP Analyzer JSFX if not present (transparent — does not "
+            "modify audio). Use this to diagnose frequency balance, identify problem areas, "
+            "and make informed EQ decisions."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": {
+                    "type": "string",
+                    "description": "Track name (or 'master' for master bus)",
                 },
-                "required": ["track"],
             },
-        ),
-        Tool(
-            name="get_loudness",
-            description=(
-                "Get LUFS loudness metering for a track — short-term LUFS (3s window), "
-                "integrated LUFS (since reset), and K-weighted RMS. Returns platform loudness "
-                "targets (Spotify -14, YouTube -14, Apple Music -16, broadcast -24, CD -9). "
-                "Requires playback to be running. Use for loudness matching and mastering."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {
-                        "type": "string",
-                        "description": "Track name (or 'master' for master bus)",
-                    },
-                    "reset": {
-                        "type": "boolean",
-                        "description": "Reset integrated LUFS counter before reading (default false)",
-                    },
+            "required": ["track"],
+        },
+    ),
+    dict(
+        name="get_loudness",
+        description=(
+            "Get LUFS loudness metering for a track — short-term LUFS (3s window), "
+            "integrated LUFS (since reset), and K-weighted RMS. Returns platform loudness "
+            "targets (Spotify -14, YouTube -14, Apple Music -16, broadcast -24, CD -9). "
+            "Requires playback to be running. Use for loudness matching and mastering."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": {
+                    "type": "string",
+                    "description": "Track name (or 'master' for master bus)",
+                },
+                "reset": {
+                    "type": "boolean",
+                    "description": "Reset integrated LUFS counter before reading (default false)",
                 },
-                "required": ["track"],
             },
-        ),
-        Tool(
-            name="audit_mix",
-            description=(
-                "Run a comprehensive mix diagnostic. Checks all tracks for: clipping (peak >= 0dBFS), "
-                "hot levels (> -6dB), very quiet tracks, master bus clipping/headroom, missing HPF, "
-                "empty tracks, tracks with no FX, and inverted phase. Returns issues sorted by "
-                "severity (error > warning > info). Playback should be running for level checks."
-            ),
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="auto_gain_stage",
-            description=(
-                "Automatically adjust track faders so all tracks peak near a target level "
-                "(default -18 dBFS). Requires playback to be running during a representative "
-                "loud section (e.g., chorus). Skips folder tracks and silent tracks. "
-                "Wrapped in undo block — Ctrl+Z to revert. Does NOT modify item gain, only faders."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {
-                        "type": "string",
-                        "description": "Specific track name, or omit for all tracks",
-                    },
-                    "target_db": {
-                        "type": "number",
-                        "description": "Target peak level in dBFS (default -18)",
-                    },
+            "required": ["track"],
+        },
+    ),
+    dict(
+        name="audit_mix",
+        description=(
+            "Run a comprehensive mix diagnostic. Checks all tracks for: clipping (peak >= 0dBFS), "
+            "hot levels (> -6dB), very quiet tracks, master bus clipping/headroom, missing HPF, "
+            "empty tracks, tracks with no FX, and inverted phase. Returns issues sorted by "
+            "severity (error > warning > info). Playback should be running for level checks."
+        ),
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    dict(
+        name="auto_gain_stage",
+        description=(
+            "Automatically adjust track faders so all tracks peak near a target level "
+            "(default -18 dBFS). Requires playback to be running during a representative "
+            "loud section (e.g., chorus). Skips folder tracks and silent tracks. "
+            "Wrapped in undo block — Ctrl+Z to revert. Does NOT modify item gain, only faders."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": {
+                    "type": "string",
+                    "description": "Specific track name, or omit for all tracks",
+                },
+                "target_db": {
+                    "type": "number",
+                    "description": "Target peak level in dBFS (default -18)",
                 },
             },
-        ),
-        Tool(
-            name="get_instrument_templates",
-            description=(
-                "Get instrument-specific FX chain templates using REAPER built-in plugins. "
-                "Returns EQ + compression settings tailored to the instrument. Templates available: "
-                "vocals, kick, snare, hi_hat, overheads, bass_electric, bass_synth, guitar_clean, "
-                "guitar_distorted, acoustic_guitar, piano_keys, synth_pad, synth_lead, strings, "
-                "brass, master. Pass the result's fx_chain directly to apply_fx_chain."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "instrument": {
-                        "type": "string",
-                        "description": (
-                            "Instrument name to get template for (e.g., 'vocals', 'kick'). "
-                            "Omit to list all available templates."
-                        ),
-                    },
+        },
+    ),
+    dict(
+        name="get_instrument_templates",
+        description=(
+            "Get instrument-specific FX chain templates using REAPER built-in plugins. "
+            "Returns EQ + compression settings tailored to the instrument. Templates available: "
+            "vocals, kick, snare, hi_hat, overheads, bass_electric, bass_synth, guitar_clean, "
+            "guitar_distorted, acoustic_guitar, piano_keys, synth_pad, synth_lead, strings, "
+            "brass, master. Pass the result's fx_chain directly to apply_fx_chain."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "instrument": {
+                    "type": "string",
+                    "description": (
+                        "Instrument name to get template for (e.g., 'vocals', 'kick'). "
+                        "Omit to list all available templates."
+                    ),
                 },
             },
-        ),
-        Tool(
-            name="detect_frequency_conflicts",
-            description=(
-                "Detect frequency masking conflicts between tracks. Uses two detection modes: "
-                "(1) EQ heuristic — scans EQ plugins for overlapping boosts within ~1 octave, "
-                "(2) Spectral — compares MCP Analyzer energy bands if present. "
-                "Returns conflicting track pairs with frequency ranges and suggestions for "
-                "complementary EQ carving."
-            ),
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="setup_sidechain",
-            description=(
-                "Set up sidechain compression or gating between two tracks. Creates a send from "
-                "trigger to target on channels 3/4 (sidechain input), adds ReaComp/ReaGate, "
-                "and configures preset parameters. Common uses: kick→bass (tighten low end), "
-                "vocal→music (ducking), kick→synth (pumping effect)."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "trigger": {
-                        "type": "string",
-                        "description": "Source/trigger track name (e.g., 'Kick')",
-                    },
-                    "target": {
-                        "type": "string",
-                        "description": "Target track to compress/gate (e.g., 'Bass')",
-                    },
-                    "effect": {
-                        "type": "string",
-                        "enum": ["compress", "gate"],
-                        "description": "Sidechain effect type (default: compress)",
-                    },
-                    "intensity": {
-                        "type": "string",
-                        "enum": ["gentle", "moderate", "heavy"],
-                        "description": "Compression/gate intensity preset (default: moderate)",
-                    },
+        },
+    ),
+    dict(
+        name="detect_frequency_conflicts",
+        description=(
+            "Detect frequency masking conflicts between tracks. Uses two detection modes: "
+            "(1) EQ heuristic — scans EQ plugins for overlapping boosts within ~1 octave, "
+            "(2) Spectral — compares MCP Analyzer energy bands if present. "
+            "Returns conflicting track pairs with frequency ranges and suggestions for "
+            "complementary EQ carving."
+        ),
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    dict(
+        name="setup_sidechain",
+        description=(
+            "Set up sidechain compression or gating between two tracks. Creates a send from "
+            "trigger to target on channels 3/4 (sidechain input), adds ReaComp/ReaGate, "
+            "and configures preset parameters. Common uses: kick→bass (tighten low end), "
+            "vocal→music (ducking), kick→synth (pumping effect)."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "trigger": {
+                    "type": "string",
+                    "description": "Source/trigger track name (e.g., 'Kick')",
+                },
+                "target": {
+                    "type": "string",
+                    "description": "Target track to compress/gate (e.g., 'Bass')",
+                },
+                "effect": {
+                    "type": "string",
+                    "enum": ["compress", "gate"],
+                    "description": "Sidechain effect type (default: compress)",
+                },
+                "intensity": {
+                    "type": "string",
+                    "enum": ["gentle", "moderate", "heavy"],
+                    "description": "Compression/gate intensity preset (default: moderate)",
                 },
-                "required": ["trigger", "target"],
             },
-        ),
-        Tool(
-            name="prepare_session",
-            description=(
-                "Clean up and prepare a session for mixing. Removes empty tracks (no items, FX, "
-                "sends, or receives — preserves folders). Creates standard bus tracks if missing: "
-                "Drum Bus, Vocal Bus, Instrument Bus, FX Bus. Wrapped in undo block."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "options": {
-                        "type": "object",
-                        "description": "Cleanup options",
-                        "properties": {
-                            "remove_empty": {
-                                "type": "boolean",
-                                "description": "Remove empty tracks (default true)",
-                            },
-                            "create_buses": {
-                                "type": "boolean",
-                                "description": "Create standard bus tracks if missing (default true)",
-                            },
+            "required": ["trigger", "target"],
+        },
+    ),
+    dict(
+        name="prepare_session",
+        description=(
+            "Clean up and prepare a session for mixing. Removes empty tracks (no items, FX, "
+            "sends, or receives — preserves folders). Creates standard bus tracks if missing: "
+            "Drum Bus, Vocal Bus, Instrument Bus, FX Bus. Wrapped in undo block."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "options": {
+                    "type": "object",
+                    "description": "Cleanup options",
+                    "properties": {
+                        "remove_empty": {
+                            "type": "boolean",
+                            "description": "Remove empty tracks (default true)",
+                        },
+                        "create_buses": {
+                            "type": "boolean",
+                            "description": "Create standard bus tracks if missing (default true)",
                         },
                     },
                 },
             },
-        ),
-        Tool(
-            name="set_track_color",
-            description=(
-                "Set a track's color in REAPER for visual organization. Common scheme: "
-                "drums=red (255,0,0), bass=orange (255,165,0), guitars=green (0,180,0), "
-                "vocals=blue (0,100,255), synths=purple (150,0,255), buses=grey (128,128,128)."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "track": {
-                        "type": "string",
-                        "description": "Track name",
-                    },
-                    "r": {
-                        "type": "integer",
-                        "description": "Red component (0-255)",
-                    },
-                    "g": {
-                        "type": "integer",
-                        "description": "Green component (0-255)",
-                    },
-                    "b": {
-                        "type": "integer",
-                        "description": "Blue component (0-255)",
-                    },
+        },
+    ),
+    dict(
+        name="set_track_color",
+        description=(
+            "Set a track's color in REAPER for visual organization. Common scheme: "
+            "drums=red (255,0,0), bass=orange (255,165,0), guitars=green (0,180,0), "
+            "vocals=blue (0,100,255), synths=purple (150,0,255), buses=grey (128,128,128)."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "track": {
+                    "type": "string",
+                    "description": "Track name",
+                },
+                "r": {
+                    "type": "integer",
+                    "description": "Red component (0-255)",
+                },
+                "g": {
+                    "type": "integer",
+                    "description": "Green component (0-255)",
+                },
+                "b": {
+                    "type": "integer",
+                    "description": "Blue component (0-255)",
                 },
-                "required": ["track", "r", "g", "b"],
             },
-        ),
-    ]
+            "required": ["track", "r", "g", "b"],
+        },
+    ),
+]
+
+# call_tool rejects names not in here without a REAPER round-trip
+_TOOLS_BY_NAME: dict[str, dict] = {spec["name"]: spec for spec in TOOL_SPECS}
+
+
+def _takes_no_arguments(spec: dict) -> bool:
+    schema = spec["inputSchema"]
+    return not schema.get("properties") and not schema.get("required")
+
+
+_CMD_TEMPLATES: dict[str, bytes] = {
+    spec["name"]: _dumps({"id": _CMD_ID_SLOT.decode(), "action": spec["name"], "params": {}})
+    for spec in TOOL_SPECS
+    if _takes_no_arguments(spec)
+}
+
+
+@functools.lru_cache(maxsize=1)
+def get_tools() -> list:
+    """TOOL_SPECS as mcp.types.Tool objects, built once per process."""
+    from mcp.types import Tool
+
+    return [Tool(**spec) for spec in TOOL_SPECS]
+
+
+# ---------------------------------------------------------------------------
+# MCP Server (only imported when actually running as server)
+# ---------------------------------------------------------------------------
+
+def run_server():
+    import asyncio
+
+    from mcp.server import Server
+    from mcp.server.stdio import stdio_server
+    from mcp.types import (
+        Tool,
+        TextContent,
+        Prompt,
+        PromptMessage,
+        GetPromptResult,
+    )
+    try:
+        import fastjsonschema
+    except ImportError:  # optional — the listener validates values anyway
+        fastjsonschema = None
+    try:
+        import uvloop
+    except ImportError:  # optional — not available on Windows
+        uvloop = None
+
+    server = Server("reaper")
+
+    def make_result(response: dict) -> list[TextContent]:
+        if response.get("success"):
+            text = _dumps_pretty(response.get("result", {}))
+        else:
+            text = f"Error: {response.get('error', 'Unknown error')}"
+        return [TextContent(type="text", text=text)]
+
+    # -- Prompt: REAPER Assistant --
+    @server.list_prompts()
+    async def list_prompts() -> list[Prompt]:
+        return [
+            Prompt(
+                name="reaper-assistant",
+                description=(
+                    "REAPER DAW assistant — gives Claude context about how to "
+                    "use the REAPER tools effectively"
+                ),
+            ),
+        ]
+
+    @server.get_prompt()
+    async def get_prompt(name: str, arguments: dict | None = None) -> GetPromptResult:
+        if name != "reaper-assistant":
+            raise ValueError(f"Unknown prompt: {name}")
+        return GetPromptResult(
+            messages=[
+                PromptMessage(
+                    role="user",
+                    content=TextContent(
+                        type="text",
+                        text=REAPER_ASSISTANT_PROMPT,
+                    ),
+                )
+            ]
+        )
+
+    # -- Tool definitions --
+    TOOLS = get_tools()
 
     @server.list_tools()
     async def list_tools() -> list[Tool]:
+        # The SDK serializes the result itself and has no hook for returning
+        # pre-encoded bytes. Dumping all tools costs ~0.2 ms per listing, so
+        # returning the shared Tool list is as far as caching needs to go.
         return TOOLS
 
+    # Compile each input schema to Python once, so malformed arguments are
+    # rejected here instead of after a REAPER round-trip. Argument-less tools
+    # (undo, play, ...) get no validator: there is nothing to check.
+    VALIDATORS = {}
+    if fastjsonschema is not None:
+        VALIDATORS = {
+            spec["name"]: fastjsonschema.compile(spec["inputSchema"])
+            for spec in TOOL_SPECS
+            if not _takes_no_arguments(spec)
+        }
+
     PREFS_FILE = IPC_DIR / "preferences.json"
 
-    @server.call_tool()
+    try:
+        # Our compiled validators replace the SDK's per-call jsonschema walk
+        register_call_tool = server.call_tool(validate_input=not VALIDATORS)
+    except TypeError:  # older mcp without built-in input validation
+        register_call_tool = server.call_tool()
+
+    @register_call_tool
     async def call_tool(name: str, arguments: dict) -> list[TextContent]:
+        if name not in _TOOLS_BY_NAME:
+            raise ValueError(f"Unknown tool: {name}")
+        validate = VALIDATORS.get(name)
+        if validate is not None:
+            try:
+                validate(arguments)
+            except fastjsonschema.JsonSchemaException as e:
+                # Raised, not returned: the SDK turns it into an isError result,
+                # worded like its own validation failure
+                raise ValueError(f"Input validation error: {e.message}") from e
+
         # Preference tools are handled locally (no REAPER round-trip)
         if name == "set_preference":
-            prefs = json.loads(PREFS_FILE.read_text()) if PREFS_FILE.exists() else {}
+            prefs = _loads(PREFS_FILE.read_bytes()) if PREFS_FILE.exists() else {}
             prefs[arguments["key"]] = arguments["value"]
-            PREFS_FILE.write_text(json.dumps(prefs, indent=2))
-            return [TextContent(type="text", text=json.dumps({"saved": arguments["key"], "value": arguments["value"]}))]
+            PREFS_FILE.write_bytes(_dumps_config(prefs))
+            return [TextContent(type="text", text=_dumps({"saved": arguments["key"], "value": arguments["value"]}).decode())]
 
         if name == "get_preferences":
-            prefs = json.loads(PREFS_FILE.read_text()) if PREFS_FILE.exists() else {}
-            return [TextContent(type="text", text=json.dumps(prefs, indent=2))]
+            prefs = _loads(PREFS_FILE.read_bytes()) if PREFS_FILE.exists() else {}
+            return [TextContent(type="text", text=_dumps_pretty(prefs))]
 
         if name == "get_instrument_templates":
             templates_path = get_project_dir() / "templates.json"
             if not templates_path.exists():
                 return [TextContent(type="text", text="Error: templates.json not found")]
-            templates = json.loads(templates_path.read_text())
+            templates = _loads(templates_path.read_bytes())
             instrument = (arguments.get("instrument") or "").strip().lower()
             if not instrument:
                 # Return all template names and descriptions
                 summary = {k: v["description"] for k, v in templates.items()}
-                return [TextContent(type="text", text=json.dumps(summary, indent=2))]
+                return [TextContent(type="text", text=_dumps_pretty(summary))]
             # Fuzzy match: exact first, then partial
             if instrument in templates:
-                return [TextContent(type="text", text=json.dumps(templates[instrument], indent=2))]
+                return [TextContent(type="text", text=_dumps_pretty(templates[instrument]))]
             matches = [k for k in templates if instrument in k or k in instrument]
             if len(matches) == 1:
-                return [TextContent(type="text", text=json.dumps(templates[matches[0]], indent=2))]
+                return [TextContent(type="text", text=_dumps_pretty(templates[matches[0]]))]
             if len(matches) > 1:
                 return [TextContent(type="text", text=f"Ambiguous instrument '{instrument}', matches: {', '.join(matches)}")]
             return [TextContent(type="text", text=f"No template found for '{instrument}'. Available: {', '.join(templates.keys())}")]
 
-        response = await asyncio.to_thread(send_command, name, arguments)
+        response = await send_command_batched(name, arguments)
         return make_result(response)
 
     async def _run():
@@ -1716,32 +2406,55 @@ def run_server():
                 read_stream, write_stream, server.create_initialization_options()
             )
 
-    asyncio.run(_run())
+    if uvloop is not None:
+        uvloop.run(_run())
+    else:
+        asyncio.run(_run())
 
 
 # ---------------------------------------------------------------------------
 # Entrypoint
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=1)
+def _help_bytes() -> bytes:
+    # f-string, not +: __doc__ is None under -OO, and print showed "None"
+    return f"{__doc__}\n".encode()
+
+
+def cmd_help():
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None or sys.platform == "win32":
+        # No byte layer, or Windows, where the text layer's \r\n
+        # translation is wanted
+        print(__doc__)
+        return
+    sys.stdout.flush()
+    buffer.write(_help_bytes())
+    buffer.flush()
+
+
+CMDS = {
+    "install": cmd_install,
+    "uninstall": cmd_uninstall,
+    "check": cmd_check,
+    "help": cmd_help,
+}
+
+
 def main():
     if len(sys.argv) < 2:
         # Default: run MCP server
         run_server()
         return
 
-    cmd = sys.argv[1].lower().lstrip("-")
-    if cmd == "install":
-        cmd_install()
-    elif cmd == "uninstall":
-        cmd_uninstall()
-    elif cmd == "check":
-        cmd_check()
-    elif cmd == "help":
-        print(__doc__)
-    else:
-        print(f"Unknown command: {sys.argv[1]}")
-        print(__doc__)
+    arg = sys.argv[1]
+    handler = CMDS.get(arg.removeprefix("--").removeprefix("-").lower())
+    if handler is None:
+        print(f"Unknown command: {arg}")
+        cmd_help()
         sys.exit(1)
+    handler()
 
 
 if __name__ == "__main__":
@@ -231,12 +231,6 @@ local function write_file(path, content)
   return true
 end
 
-local function file_exists(path)
-  local f = io.open(path, "r")
-  if f then f:close(); return true end
-  return false
-end
-
 local function delete_file(path)
   os.remove(path)
 end
@@ -247,26 +241,35 @@ end
 -- Returns (track, nil) on success, (nil, error_string) on failure.
 -- ============================================================================
 
-local function resolve_track(name)
-  if not name or name == "" then return nil, "No track name provided" end
-  if name:lower() == "master" then
-    return reaper.GetMasterTrack(0), nil
-  end
-  local name_lower = name:lower()
-  local matches = {}
+-- Track names (and their lowercased forms) are gathered once and reused
+-- until the project changes: keyed on the active project, its state change
+-- count and the track count. execute_command also drops the cache after
+-- every mutating command, and undo/redo drop it too (they run outside an
+-- undo block), in case a change didn't register as a new state.
+local track_name_cache = nil
+
+local function track_name_list()
+  local proj = reaper.EnumProjects(-1)
+  local state = reaper.GetProjectStateChangeCount(proj)
   local num_tracks = reaper.CountTracks(0)
+  local c = track_name_cache
+  if c and c.proj == proj and c.state == state and c.count == num_tracks then
+    return c
+  end
 
-  for i = 0, num_tracks - 1 do
-    local track = reaper.GetTrack(0, i)
+  c = {proj = proj, state = state, count = num_tracks, tracks = {}, names = {}, lowers = {}}
+  for i = 1, num_tracks do
+    local track = reaper.GetTrack(0, i - 1)
     local _, track_name = reaper.GetTrackName(track)
-    if track_name:lower() == name_lower then
-      return track, nil -- exact match, return immediately
-    end
-    if track_name:lower():find(name_lower, 1, true) then
-      matches[#matches+1] = {track = track, name = track_name}
-    end
+    c.tracks[i] = track
+    c.names[i] = track_name
+    c.lowers[i] = track_name:lower()
   end
+  track_name_cache = c
+  return c
+end
 
+local function pick_track_match(name, matches)
   if #matches == 1 then return matches[1].track, nil end
   if #matches == 0 then
     return nil, "No track found matching '" .. name .. "'"
@@ -276,6 +279,72 @@ local function resolve_track(name)
   return nil, "Ambiguous track name '" .. name .. "', matches: " .. table.concat(names, ", ")
 end
 
+local function resolve_track(name)
+  if not name or name == "" then return nil, "No track name provided" end
+  local name_lower = name:lower()
+  if name_lower == "master" then
+    return reaper.GetMasterTrack(0), nil
+  end
+  local matches = {}
+  local list = track_name_list()
+  local lowers = list.lowers
+
+  for i = 1, list.count do
+    local track_lower = lowers[i]
+    if track_lower == name_lower then
+      return list.tracks[i], nil -- exact match, return immediately
+    end
+    if track_lower:find(name_lower, 1, true) then
+      matches[#matches+1] = {track = list.tracks[i], name = list.names[i]}
+    end
+  end
+
+  return pick_track_match(name, matches)
+end
+
+-- Resolve two track names (send source/dest, sidechain trigger/target) in a
+-- single pass over the track list. Same rules and errors as resolve_track.
+-- Returns (track_a, err_a, track_b, err_b).
+local function resolve_track_pair(name_a, name_b)
+  if not name_a or name_a == "" or not name_b or name_b == ""
+      or name_a:lower() == "master" or name_b:lower() == "master" then
+    local a, err_a = resolve_track(name_a)
+    local b, err_b = resolve_track(name_b)
+    return a, err_a, b, err_b
+  end
+
+  local lower_a, lower_b = name_a:lower(), name_b:lower()
+  local exact_a, exact_b
+  local matches_a, matches_b = {}, {}
+  local list = track_name_list()
+  local lowers = list.lowers
+
+  for i = 1, list.count do
+    local track_lower = lowers[i]
+    if not exact_a then
+      if track_lower == lower_a then
+        exact_a = list.tracks[i]
+      elseif track_lower:find(lower_a, 1, true) then
+        matches_a[#matches_a+1] = {track = list.tracks[i], name = list.names[i]}
+      end
+    end
+    if not exact_b then
+      if track_lower == lower_b then
+        exact_b = list.tracks[i]
+      elseif track_lower:find(lower_b, 1, true) then
+        matches_b[#matches_b+1] = {track = list.tracks[i], name = list.names[i]}
+      end
+    end
+    if exact_a and exact_b then break end
+  end
+
+  local a, err_a = exact_a, nil
+  if not a then a, err_a = pick_track_match(name_a, matches_a) end
+  local b, err_b = exact_b, nil
+  if not b then b, err_b = pick_track_match(name_b, matches_b) end
+  return a, err_a, b, err_b
+end
+
 -- ============================================================================
 -- FX resolution
 -- Case-insensitive, partial match. Accepts name (string) or index (number).
@@ -295,8 +364,9 @@ local function resolve_fx(track, fx_name)
 
   for i = 0, count - 1 do
     local _, name = reaper.TrackFX_GetFXName(track, i)
-    if name:lower() == fx_name_lower then return i, nil end
-    if name:lower():find(fx_name_lower, 1, true) then
+    local name_lower = name:lower()
+    if name_lower == fx_name_lower then return i, nil end
+    if name_lower:find(fx_name_lower, 1, true) then
       matches[#matches+1] = {index = i, name = name}
     end
   end
@@ -783,9 +853,8 @@ end
 
 -- Routing
 function handlers.create_send(params)
-  local src, err = resolve_track(params.source)
+  local src, err, dest, derr = resolve_track_pair(params.source, params.dest)
   if not src then return nil, "Source: " .. err end
-  local dest, derr = resolve_track(params.dest)
   if not dest then return nil, "Dest: " .. derr end
   if src == dest then return nil, "Cannot create a send from a track to itself" end
   local send_idx = reaper.CreateTrackSend(src, dest)
@@ -799,9 +868,8 @@ function handlers.create_send(params)
 end
 
 function handlers.remove_send(params)
-  local src, err = resolve_track(params.source)
+  local src, err, dest, derr = resolve_track_pair(params.source, params.dest)
   if not src then return nil, "Source: " .. err end
-  local dest, derr = resolve_track(params.dest)
   if not dest then return nil, "Dest: " .. derr end
   local send_count = reaper.GetTrackNumSends(src, 0)
   for i = 0, send_count - 1 do
@@ -815,9 +883,8 @@ function handlers.remove_send(params)
 end
 
 function handlers.set_send_volume(params)
-  local src, err = resolve_track(params.source)
+  local src, err, dest, derr = resolve_track_pair(params.source, params.dest)
   if not src then return nil, "Source: " .. err end
-  local dest, derr = resolve_track(params.dest)
   if not dest then return nil, "Dest: " .. derr end
   local db = tonumber(params.db)
   if not db then return nil, "Invalid dB value" end
@@ -935,17 +1002,20 @@ function handlers.ping()
     reaper_version = reaper.GetAppVersion(),
     project = reaper.GetProjectName(0),
     track_count = reaper.CountTracks(0),
+    batch = true, -- understands {"batch": [...]} commands (see poll)
   }
 end
 
 -- Undo/Redo
 function handlers.undo()
   reaper.Main_OnCommand(40029, 0)
+  track_name_cache = nil -- may have reverted a track rename/add/delete
   return {action = "undo"}
 end
 
 function handlers.redo()
   reaper.Main_OnCommand(40030, 0)
+  track_name_cache = nil
   return {action = "redo"}
 end
 
@@ -1767,9 +1837,8 @@ function handlers.setup_sidechain(params)
   if not params.trigger then return nil, "Missing 'trigger' track parameter" end
   if not params.target then return nil, "Missing 'target' track parameter" end
 
-  local trigger, err1 = resolve_track(params.trigger)
+  local trigger, err1, target, err2 = resolve_track_pair(params.trigger, params.target)
   if not trigger then return nil, "Trigger: " .. err1 end
-  local target, err2 = resolve_track(params.target)
   if not target then return nil, "Target: " .. err2 end
 
   local effect = params.effect or "compress"
@@ -2005,6 +2074,7 @@ local function execute_command(cmd)
 
   if not is_readonly then
     reaper.Undo_EndBlock("MCP: " .. action, -1)
+    track_name_cache = nil
   end
 
   if not ok then
@@ -2034,11 +2104,13 @@ local function poll()
   end
   last_poll = now
 
-  if file_exists(CMD_FILE) then
-    local content = read_file(CMD_FILE)
+  -- One open per tick: read_file returns nil when there's no command, so
+  -- no separate existence probe is needed.
+  local content = read_file(CMD_FILE)
+  if content then
     delete_file(CMD_FILE)
 
-    if content and content ~= "" then
+    if content ~= "" then
       if #content > MAX_CMD_SIZE then
         write_file(RSP_FILE, json.encode({
           id = "unknown", success = false, result = nil,
@@ -2049,6 +2121,23 @@ local function poll()
         if cmd and cmd.action then
           local response = execute_command(cmd)
           write_file(RSP_FILE, json.encode(response))
+        elseif cmd and type(cmd.batch) == "table" then
+          -- Several commands coalesced by the MCP server: run them in order
+          -- within this tick and answer with one response file.
+          local responses = {}
+          for i, sub in ipairs(cmd.batch) do
+            if type(sub) == "table" and sub.action then
+              responses[i] = execute_command(sub)
+            else
+              responses[i] = {
+                id = type(sub) == "table" and sub.id or "unknown",
+                success = false, result = nil, error = "Invalid batch entry",
+              }
+            end
+          end
+          write_file(RSP_FILE, json.encode({
+            id = cmd.id, success = true, responses = responses,
+          }))
         elseif parse_err then
           write_file(RSP_FILE, json.encode({
             id = "unknown", success = false, result = nil,